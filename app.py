@@ -32,13 +32,14 @@ import requests
 import os
 import tempfile
 from urllib.parse import urlparse
-from utils.terabox_core import TeraboxCore
-from utils.terabox_official_api import TeraBoxOfficialAPI
-from utils.terabox_cookie_api import TeraBoxCookieAPI
-from utils.terabox_rapidapi import TeraBoxRapidAPI
 import time
-from typing import Dict, Any, List
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Dict, Any, List, NamedTuple
 import base64
+import html
 import json
 from utils.browser_utils import open_direct_file_link, display_browser_open_result, create_browser_selection_ui
 from utils.state_manager import StateManager, BatchStateUpdate
@@ -116,13 +117,34 @@ st.markdown("""
 # Strategy: Only initialize if not already present to preserve user data
 log_info("Initializing application session state")
 
-if 'files_data' not in st.session_state:
-    st.session_state.files_data = None
-    log_info("Initialized files_data state")
+@dataclass(frozen=True)
+class _FilesSnapshot:
+    """Immutable pickled copy of an extraction result, unpickled on first access"""
+    blob: bytes
 
-if 'extraction_params' not in st.session_state:
-    st.session_state.extraction_params = None
-    log_info("Initialized extraction_params state")
+    @classmethod
+    def from_result(cls, result: Dict[str, Any]) -> "_FilesSnapshot":
+        return cls(pickle.dumps(result, protocol=5))
+
+    @cached_property
+    def data(self) -> Dict[str, Any]:
+        return pickle.loads(self.blob)
+
+# Extract with unchanged inputs reuses results younger than this; older ones are
+# re-extracted so the sign/timestamp link params are refreshed
+_RESULTS_FRESH_SECONDS = 300
+
+class _State(NamedTuple):
+    """Extraction results owned by the main page, kept under a single session key"""
+    files_data: Any = None  # _FilesSnapshot of the last successful extraction
+    extraction_params: Any = None
+    link_params: Any = None  # extraction_params pre-stringified for generate_download_links
+    source_key: Any = None  # (url, api_mode, mode) that produced files_data
+    extracted_at: float = 0.0  # time.time() of that extraction
+
+if 'app_state' not in st.session_state:
+    st.session_state.app_state = _State()
+    log_info("Initialized app_state (files_data, extraction_params)")
 
 if 'api_mode' not in st.session_state:
     st.session_state.api_mode = 'unofficial'  # Default to unofficial mode
@@ -172,7 +194,7 @@ def display_mode_indicator(mode: int):
     </div>
     ''', unsafe_allow_html=True)
 
-def extract_files_from_url(url: str, mode: int = None) -> Dict[str, Any]:
+def extract_files_from_url(url: str, mode: int = None, prefetch_thumbnails: bool = False) -> Dict[str, Any]:
     """
     Extract files from TeraBox URL with comprehensive error handling and mode routing
     
@@ -182,6 +204,7 @@ def extract_files_from_url(url: str, mode: int = None) -> Dict[str, Any]:
     Args:
         url: TeraBox share URL to process
         mode: Processing mode for unofficial extraction (1, 2, or 3)
+        prefetch_thumbnails: Resolve thumbnail URLs concurrently (Official API mode only)
         
     Returns:
         Dict containing extraction results or error information
@@ -226,6 +249,8 @@ def extract_files_from_url(url: str, mode: int = None) -> Dict[str, Any]:
             progress_bar.progress(20)
             
             # Initialize TeraBox core processor with specified mode
+            # Imported here so sessions using other modes skip the scraper stack
+            from utils.terabox_core import TeraboxCore
             terabox = TeraboxCore(mode=mode)
             log_info(f"TeraboxCore initialized successfully for mode {mode}")
             
@@ -289,6 +314,14 @@ def extract_files_from_url(url: str, mode: int = None) -> Dict[str, Any]:
                             'list': []
                         }
                         result['list'].append(file_info)
+
+                # Thumbnail Prefetch
+                # Purpose: Resolve final CDN hosts for file-card previews
+                # Strategy: Overlap HEAD requests instead of serial round-trips
+                if prefetch_thumbnails and len(result['list']) > 4:
+                    status_text.text("🖼️ Prefetching thumbnails...")
+                    progress_bar.progress(60)
+                    _prefetch_thumbnails(api.session, result['list'])
             else:
                 result = {'status': 'failed', 'message': share_info.get('message', 'Failed to get share info')}
         
@@ -459,6 +492,21 @@ def _get_file_type_from_category(category: str) -> str:
     }
     return category_map.get(str(category), 'other')
 
+def _prefetch_thumbnails(session: requests.Session, items: List[Dict[str, Any]], max_workers: int = 8):
+    """Resolve thumbnail redirects in parallel and store the final URL on each item"""
+    def resolve(item):
+        try:
+            response = session.head(item['image'], timeout=2, allow_redirects=True)
+            item['image'] = response.url
+        except requests.exceptions.RequestException as e:
+            log_info(f"Thumbnail prefetch skipped for {item.get('name', 'Unknown')}: {e}")
+
+    pending = [item for item in items if item.get('image')]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(resolve, pending))
+
+    log_info(f"Thumbnail prefetch completed - {len(pending)} item(s)")
+
 def flatten_file_list(files: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Flatten nested file structure"""
     flat_files = []
@@ -473,6 +521,48 @@ def flatten_file_list(files: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     process_files(files)
     return flat_files
 
+def _get_file_view_cache(files_data: _FilesSnapshot) -> Dict[str, Any]:
+    """Return the per-session filter/sort cache, rebuilding it when files_data changes"""
+    cache = st.session_state.get('file_view_cache')
+    if not cache or cache['source'] is not files_data:
+        cache = {
+            'source': files_data,
+            'flat': flatten_file_list(files_data.data.get('list', [])),
+            'filtered': {},
+            'sorted': {}
+        }
+        st.session_state.file_view_cache = cache
+    return cache
+
+def _filter_files(view_cache: Dict[str, Any], file_type_filter: str) -> List[Dict[str, Any]]:
+    """Filter flattened files by type, reusing the cached result for this filter"""
+    filtered = view_cache['filtered'].get(file_type_filter)
+    if filtered is None:
+        flat_files = view_cache['flat']
+        if file_type_filter == 'all':
+            filtered = flat_files
+        else:
+            filtered = [f for f in flat_files if f.get('type') == file_type_filter]
+        view_cache['filtered'][file_type_filter] = filtered
+    return filtered
+
+def _sort_files(view_cache: Dict[str, Any], file_type_filter: str, sort_by: str) -> List[Dict[str, Any]]:
+    """Sort the filtered files, reusing the cached result for this filter/sort pair"""
+    key = (file_type_filter, sort_by)
+    sorted_files = view_cache['sorted'].get(key)
+    if sorted_files is None:
+        filtered = _filter_files(view_cache, file_type_filter)
+        if sort_by == 'name':
+            sorted_files = sorted(filtered, key=lambda x: x.get('name', '').lower())
+        elif sort_by == 'size':
+            sorted_files = sorted(filtered, key=lambda x: int(x.get('size', 0)), reverse=True)
+        elif sort_by == 'type':
+            sorted_files = sorted(filtered, key=lambda x: x.get('type', ''))
+        else:
+            sorted_files = filtered
+        view_cache['sorted'][key] = sorted_files
+    return sorted_files
+
 def display_file_card(file_info: Dict[str, Any], index: int):
     """Display individual file card with enhanced RapidAPI support"""
     file_type = file_info.get('type', 'other')
@@ -496,8 +586,14 @@ def display_file_card(file_info: Dict[str, Any], index: int):
         col1, col2, col3 = st.columns([2, 1, 1])
         
         with col1:
-            st.markdown(f"**{emoji} {file_name}**")
-            st.caption(f"Type: {file_type.title()} | Size: {size_mb:.1f} MB")
+            # Name and details in one delta instead of markdown + caption;
+            # names/types come from the remote share, so escape them before
+            # they reach unsafe_allow_html
+            st.markdown(
+                f"**{emoji} {html.escape(str(file_name))}**  \n"
+                f"<small>Type: {html.escape(str(file_type).title())} | Size: {size_mb:.1f} MB</small>",
+                unsafe_allow_html=True
+            )
             
             # Show service info if available
             if file_info.get('service_info'):
@@ -546,22 +642,18 @@ def download_file(file_info: Dict[str, Any], index: int):
         download_rapidapi_file(file_info, index)
         return
     
-    if not st.session_state.extraction_params:
+    params = st.session_state.app_state.extraction_params
+    if not params:
         st.error("No extraction parameters available. Please extract files first.")
         return
     
-    params = st.session_state.extraction_params
+    from utils.terabox_core import TeraboxCore
     terabox = TeraboxCore(mode=params.get('mode', 3))
     
     with st.spinner(f"🔗 Generating download links for {file_info['name']}..."):
         links_result = terabox.generate_download_links(
             fs_id=str(file_info['fs_id']),
-            uk=str(params.get('uk', '')),
-            shareid=str(params.get('shareid', '')),
-            timestamp=str(params.get('timestamp', '')),
-            sign=str(params.get('sign', '')),
-            js_token=str(params.get('js_token', '')),
-            cookie=str(params.get('cookie', ''))
+            **st.session_state.app_state.link_params
         )
     
     if links_result.get('status') == 'success':
@@ -579,7 +671,7 @@ def download_file(file_info: Dict[str, Any], index: int):
                 # Create download button with the actual file content
                 try:
                     if st.button(f"⬇️ Option {i}", key=f"direct_download_{index}_{i}"):
-                        download_file_direct(url, file_info['name'])
+                        download_file_direct(url, file_info['name'], key=f"{file_info['fs_id']}_{i}")
                 except Exception as e:
                     st.error(f"Error creating download button: {e}")
     else:
@@ -680,47 +772,57 @@ def download_rapidapi_file(file_info: Dict[str, Any], index: int):
         speed_text.empty()
         st.error(f"❌ Unexpected error: {str(e)}")
 
-def download_file_direct(url: str, filename: str):
-    """Download file directly through Streamlit"""
-    try:
-        with st.spinner(f"📥 Downloading {filename}..."):
-            response = requests.get(url, stream=True)
+def download_file_direct(url: str, filename: str, key: str):
+    """
+    Download file directly through Streamlit
+    
+    The file is fetched only when Save is clicked instead of on render. This
+    only defers the download: the whole file is still buffered in memory
+    (response.content) before Streamlit serves it, nothing is streamed.
+    A failed fetch is logged and re-raised; Streamlit then reports the failed
+    download on the Save button itself.
+    """
+    def fetch_file() -> bytes:
+        # Deferred: runs when the user clicks Save, not on every render, and
+        # outside the script run, so st.* calls here would be ignored
+        try:
+            response = requests.get(url, timeout=(5, 60))
             response.raise_for_status()
-            
-            # Create download button with file content
-            st.download_button(
-                label=f"💾 Save {filename}",
-                data=response.content,
-                file_name=filename,
-                mime="application/octet-stream",
-                key=f"save_{filename}_{int(time.time())}"
-            )
-            
-        st.success("✅ File ready for download!")
+            return response.content
+        except requests.exceptions.RequestException as e:
+            log_error(e, f"download_file_direct - {filename}")
+            raise
+    
+    try:
+        # on_click="ignore": no rerun on click, so this button and its deferred
+        # fetch stay registered while the download runs
+        st.download_button(
+            label=f"💾 Save {filename}",
+            data=fetch_file,
+            file_name=filename,
+            mime="application/octet-stream",
+            key=f"save_{key}",
+            on_click="ignore"
+        )
+        st.caption("📥 The file is fetched when you click Save")
         
-    except requests.exceptions.RequestException as e:
-        st.error(f"❌ Download failed: {e}")
     except Exception as e:
         st.error(f"❌ Unexpected error: {e}")
 
 def stream_video(file_info: Dict[str, Any], index: int):
     """Stream video file"""
-    if not st.session_state.extraction_params:
+    params = st.session_state.app_state.extraction_params
+    if not params:
         st.error("No extraction parameters available. Please extract files first.")
         return
     
-    params = st.session_state.extraction_params
+    from utils.terabox_core import TeraboxCore
     terabox = TeraboxCore(mode=params.get('mode', 3))
     
     with st.spinner(f"🎬 Preparing video stream for {file_info['name']}..."):
         links_result = terabox.generate_download_links(
             fs_id=str(file_info['fs_id']),
-            uk=str(params.get('uk', '')),
-            shareid=str(params.get('shareid', '')),
-            timestamp=str(params.get('timestamp', '')),
-            sign=str(params.get('sign', '')),
-            js_token=str(params.get('js_token', '')),
-            cookie=str(params.get('cookie', ''))
+            **st.session_state.app_state.link_params
         )
     
     if links_result.get('status') == 'success':
@@ -758,22 +860,18 @@ def open_file_link(file_info: Dict[str, Any], index: int):
             result = open_direct_file_link(file_info['rapidapi_data'], browser=preferred_browser)
         else:
             # For other files, we need to generate the download link first
-            if not st.session_state.extraction_params:
+            params = st.session_state.app_state.extraction_params
+            if not params:
                 st.error("❌ No extraction parameters available. Please extract files first.")
                 return
             
-            params = st.session_state.extraction_params
+            from utils.terabox_core import TeraboxCore
             terabox = TeraboxCore(mode=params.get('mode', 3))
             
             # Generate download links
             links_result = terabox.generate_download_links(
                 fs_id=str(file_info['fs_id']),
-                uk=str(params.get('uk', '')),
-                shareid=str(params.get('shareid', '')),
-                timestamp=str(params.get('timestamp', '')),
-                sign=str(params.get('sign', '')),
-                js_token=str(params.get('js_token', '')),
-                cookie=str(params.get('cookie', ''))
+                **st.session_state.app_state.link_params
             )
             
             if links_result.get('status') == 'success':
@@ -848,6 +946,8 @@ def main():
         
         st.markdown("---")
         
+        prefetch_thumbnails = False
+        
         # Mode selection (only for unofficial mode)
         if api_mode == 'unofficial':
             mode = st.selectbox(
@@ -866,6 +966,12 @@ def main():
             else:
                 st.warning("🔐 **Not Authenticated**")
                 st.caption("Configure credentials in API Mode page")
+            
+            prefetch_thumbnails = st.checkbox(
+                "Prefetch thumbnails",
+                value=False,
+                help="Resolve thumbnail URLs in parallel for shares with many files"
+            )
         
         elif api_mode == 'cookie':
             mode = None
@@ -909,16 +1015,26 @@ def main():
         
         # Clear button
         if st.button("🗑️ Clear Results"):
-            st.session_state.files_data = None
-            st.session_state.extraction_params = None
             # Results cleared - using state manager for clean updates
-            StateManager.update_multiple_states({
-                'files_data': None,
-                'extraction_params': None
-            }, "Results cleared successfully!")
+            StateManager.update_state('app_state', _State(), "Results cleared successfully!")
+            # Drop the flattened/sorted views too so the old result set is freed
+            StateManager.clear_state(['file_view_cache'])
     
     # Main content area
-    if extract_button and terabox_url:
+    # Skip re-extraction when the results on screen came from the same URL,
+    # API mode and processing mode, and are still fresh
+    extraction_key = (terabox_url, st.session_state.api_mode, mode)
+    app_state = st.session_state.app_state
+    already_extracted = bool(
+        extract_button and app_state.files_data
+        and app_state.source_key == extraction_key
+        and time.time() - app_state.extracted_at < _RESULTS_FRESH_SECONDS
+    )
+    if already_extracted:
+        log_info(f"Skipping extraction - fresh results already loaded for: {terabox_url}")
+        st.info("ℹ️ Files from this link were just loaded with these settings.")
+    
+    if extract_button and terabox_url and not already_extracted:
         # URL Validation
         # Purpose: Validate TeraBox URL before processing
         # Strategy: Check against known TeraBox domain patterns
@@ -950,11 +1066,10 @@ def main():
         log_info(f"URL validation passed - Domain recognized in: {terabox_url}")
         
         # Extract files
-        result = extract_files_from_url(terabox_url, mode)
+        result = extract_files_from_url(terabox_url, mode, prefetch_thumbnails)
         
         if result.get('status') == 'success':
-            st.session_state.files_data = result
-            st.session_state.extraction_params = {
+            extraction_params = {
                 'mode': mode,
                 'uk': result.get('uk'),
                 'shareid': result.get('shareid'),
@@ -963,6 +1078,17 @@ def main():
                 'js_token': result.get('js_token'),
                 'cookie': result.get('cookie')
             }
+            link_params = {
+                key: str(extraction_params[key])
+                for key in ('uk', 'shareid', 'timestamp', 'sign', 'js_token', 'cookie')
+            }
+            st.session_state.app_state = st.session_state.app_state._replace(
+                files_data=_FilesSnapshot.from_result(result),
+                extraction_params=extraction_params,
+                link_params=link_params,
+                source_key=extraction_key,
+                extracted_at=time.time()
+            )
             # Files extracted successfully - using state manager
             StateManager.update_state('files_extracted', True)
             # UI will update automatically to show the files
@@ -1016,9 +1142,10 @@ def main():
                 st.markdown("- Use the Network Diagnostics page for detailed testing")
     
     # Display extracted files
-    if st.session_state.files_data:
-        files_list = st.session_state.files_data.get('list', [])
-        flat_files = flatten_file_list(files_list)
+    files_data = st.session_state.app_state.files_data
+    if files_data:
+        view_cache = _get_file_view_cache(files_data)
+        flat_files = view_cache['flat']
         
         if flat_files:
             st.header(f"📁 Found {len(flat_files)} file(s)")
@@ -1039,18 +1166,8 @@ def main():
                     index=0
                 )
             
-            # Apply filters
-            filtered_files = flat_files
-            if file_type_filter != 'all':
-                filtered_files = [f for f in flat_files if f.get('type') == file_type_filter]
-            
-            # Apply sorting
-            if sort_by == 'name':
-                filtered_files.sort(key=lambda x: x.get('name', '').lower())
-            elif sort_by == 'size':
-                filtered_files.sort(key=lambda x: int(x.get('size', 0)), reverse=True)
-            elif sort_by == 'type':
-                filtered_files.sort(key=lambda x: x.get('type', ''))
+            # Apply filters and sorting (each stage memoized independently)
+            filtered_files = _sort_files(view_cache, file_type_filter, sort_by)
             
             # Display files
             st.write(f"Showing {len(filtered_files)} file(s)")
@@ -67,7 +67,7 @@ col1, col2, col3 = st.columns(3)
 with col1:
     st.subheader("🏗️ Built With")
     st.markdown("""
-    - **Python 3.8+**
+    - **Python 3.10+**
     - **Streamlit** - Web framework
     - **Requests** - HTTP library
     - **CloudScraper** - Anti-bot bypass
@@ -119,7 +119,7 @@ with col1:
     version_info = {
         "TeraDL Streamlit Version": "1.0.0",
         "Based on TeraDL": "v1.5.5",
-        "Python Version Required": "3.8+",
+        "Python Version Required": "3.10+",
         "Last Updated": datetime.datetime.now().strftime("%Y-%m-%d"),
         "License": "Educational Use"
     }
@@ -8,6 +8,16 @@ from utils.browser_utils import open_direct_file_link, display_browser_open_resu
 from utils.state_manager import StateManager, BatchStateUpdate
 from utils.ui_manager import UIManager, show_success_if
 
+# Cookie export columns are separated by tabs or runs of whitespace
+_FIELD_SPLIT_RE = re.compile(r'\t+|\s{2,}')
+
+# Important TeraBox cookies and session-related cookie names
+_IMPORTANT_COOKIES = frozenset(('ndus', 'BDUSS', 'STOKEN', 'csrfToken', 'lang'))
+_SESSION_COOKIES = frozenset(('sessionid', 'session', 'auth', 'token'))
+# Name fragments of TeraBox-related, bid (common in TeraBox) and stripe (payment) cookies
+_RELATED_COOKIE_RE = re.compile(r'terabox|1024|bid|stripe', re.IGNORECASE)
+_QUOTES = '"\''
+
 def parse_tabular_cookies(cookie_data: str) -> Dict[str, str]:
     """
     Parse cookies from tabular format (browser export format)
@@ -21,16 +31,20 @@ def parse_tabular_cookies(cookie_data: str) -> Dict[str, str]:
     Returns:
         Dict[str, str]: Dictionary of cookie name-value pairs
     """
-    cookies = {}
-    lines = cookie_data.strip().split('\n')
-    
-    for line in lines:
+    return dict(_iter_cookie_pairs(cookie_data))
+
+def _iter_cookie_pairs(cookie_data: str):
+    """Yield (name, value) for each usable line of tabular cookie data"""
+    for line in cookie_data.splitlines():
         line = line.strip()
         if not line:
             continue
             
-        # Split by tabs (most common) or multiple spaces
-        fields = re.split(r'\t+|\s{2,}', line)
+        # Split by tabs (most common) or multiple spaces; only name and value are used.
+        # Browser exports are single-tab separated, so try a plain split first.
+        fields = line.split('\t', 2)
+        if len(fields) < 2 or not fields[1]:
+            fields = _FIELD_SPLIT_RE.split(line, maxsplit=2)
         
         if len(fields) >= 2:
             cookie_name = fields[0].strip()
@@ -38,9 +52,7 @@ def parse_tabular_cookies(cookie_data: str) -> Dict[str, str]:
             
             # Skip empty names or values
             if cookie_name and cookie_value:
-                cookies[cookie_name] = cookie_value
-    
-    return cookies
+                yield cookie_name, cookie_value
 
 def filter_terabox_cookies(cookies: Dict[str, str]) -> Dict[str, str]:
     """
@@ -52,29 +64,14 @@ def filter_terabox_cookies(cookies: Dict[str, str]) -> Dict[str, str]:
     Returns:
         Dict[str, str]: Filtered TeraBox cookies
     """
-    # Important TeraBox cookies
-    important_cookies = ['ndus', 'BDUSS', 'STOKEN', 'csrfToken', 'lang']
-    
-    # TeraBox domain patterns
-    terabox_domains = ['terabox.com', '1024terabox.com', 'terabox.app']
-    
     filtered = {}
     
     for name, value in cookies.items():
-        # Include important cookies regardless of domain
-        if name in important_cookies:
-            filtered[name] = value
-        # Include cookies that might be TeraBox related
-        elif any(domain in name.lower() for domain in ['terabox', '1024']):
-            filtered[name] = value
-        # Include session-related cookies
-        elif name.lower() in ['sessionid', 'session', 'auth', 'token']:
-            filtered[name] = value
-        # Include bid cookies (common in TeraBox)
-        elif 'bid' in name.lower():
-            filtered[name] = value
-        # Include stripe cookies (payment-related)
-        elif 'stripe' in name.lower():
+        # Include important cookies regardless of domain, cookies that might be
+        # TeraBox related (including bid and stripe cookies) and session cookies
+        if (name in _IMPORTANT_COOKIES
+                or _RELATED_COOKIE_RE.search(name)
+                or name.lower() in _SESSION_COOKIES):
             filtered[name] = value
     
     return filtered
@@ -89,13 +86,8 @@ def format_cookie_string(cookies: Dict[str, str]) -> str:
     Returns:
         str: Formatted cookie string
     """
-    cookie_pairs = []
-    for name, value in cookies.items():
-        # Clean the value (remove quotes if present)
-        clean_value = value.strip('"\'')
-        cookie_pairs.append(f"{name}={clean_value}")
-    
-    return "; ".join(cookie_pairs)
+    # Clean each value (remove quotes if present)
+    return "; ".join(f"{name}={value.strip(_QUOTES)}" for name, value in cookies.items())
 
 def auto_detect_cookie_format(cookie_input: str) -> str:
     """
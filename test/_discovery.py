@@ -0,0 +1,33 @@
+"""
+Shared unittest discovery for the standalone test runners
+
+The test directory is walked once per process; each runner then picks its
+own tests out of the cached suite instead of calling loader.discover() again.
+"""
+import functools
+import os
+import unittest
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+@functools.lru_cache(maxsize=None)
+def all_suites() -> unittest.TestSuite:
+    """Discover every test_*.py module in the test directory (cached)"""
+    return unittest.TestLoader().discover(TEST_DIR, pattern='test_*.py', top_level_dir=TEST_DIR)
+
+
+def _iter_tests(suite: unittest.TestSuite):
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from _iter_tests(test)
+        else:
+            yield test
+
+
+def module_tests(module_name: str) -> unittest.TestSuite:
+    """Return a new suite holding the discovered tests defined in module_name"""
+    return unittest.TestSuite(
+        test for test in _iter_tests(all_suites())
+        if type(test).__module__ == module_name
+    )
@@ -0,0 +1,37 @@
+"""
+Output helpers shared by the standalone test runners
+
+The runners print dozens of short lines; when stdout is a pipe or a CI log
+file each print() becomes its own write() call. buffered_stdout() collects
+them in one large buffer and flushes once when the runner finishes.
+"""
+import io
+import sys
+from contextlib import contextmanager
+
+
+@contextmanager
+def buffered_stdout(buffer_size: int = 65536):
+    """Route print() through a single large buffer, flushed on exit"""
+    original = sys.stdout
+    raw = getattr(getattr(original, 'buffer', None), 'raw', None)
+    if raw is None:
+        # stdout already replaced (e.g. captured by pytest) - leave it alone
+        yield original
+        return
+
+    original.flush()
+    stream = io.TextIOWrapper(
+        io.BufferedWriter(raw, buffer_size=buffer_size),
+        encoding=original.encoding,
+        errors=original.errors,
+        write_through=False
+    )
+    sys.stdout = stream
+    try:
+        yield stream
+    finally:
+        stream.flush()
+        # Detach both layers so the real stdout file descriptor stays open
+        stream.detach().detach()
+        sys.stdout = original
@@ -0,0 +1,16 @@
+"""
+Shared pytest configuration for the TeraDL test suite
+
+The suite is designed to run sharded across workers with pytest-xdist:
+    pytest -n auto --dist=loadfile test/
+
+--dist=loadfile keeps every module on a single worker, so heavy imports such
+as utils.terabox_rapidapi happen once per file instead of once per test.
+With --dist=loadgroup, modules marked xdist_group("rapidapi") additionally
+share one worker, so the RapidAPI client stack is imported once for all of them.
+"""
+
+
+def pytest_configure(config):
+    # Registered here so runs without pytest-xdist do not warn about it
+    config.addinivalue_line("markers", "xdist_group(name): run tests of the same group on one xdist worker")
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Sample RapidAPI Key Validation Demo
+
+Validates a few sample keys and prints the result for each one. Kept out of
+the test runner's module scope because importing TeraBoxRapidAPI pulls in
+requests, streamlit and the cache/key managers.
+"""
+
+import sys
+import os
+
+# Add the parent directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+try:
+    from utils.terabox_rapidapi import TeraBoxRapidAPI
+    _IMPORT_ERROR = None
+except ImportError as e:
+    TeraBoxRapidAPI = None
+    _IMPORT_ERROR = e
+
+# Client reused by every validate_sample_keys() call
+_CLIENT = None
+
+def validate_sample_keys():
+    """Validate some sample API keys for demonstration"""
+    print("\n🔍 Sample Key Validation Demo")
+    print("-" * 30)
+    
+    global _CLIENT
+    
+    if TeraBoxRapidAPI is None:
+        print(f"❌ Could not import TeraBoxRapidAPI: {_IMPORT_ERROR}")
+        print("Make sure you're running from the correct directory")
+        return
+    
+    if _CLIENT is None:
+        _CLIENT = TeraBoxRapidAPI()
+    
+    sample_keys = {
+        "Valid Format": "298bbd7e09msh8c672d04ba26de4p154bc9jsn9de6459d8a13",
+        "Too Short": "298bbd7e09msh8c672d04ba26de4p154bc9jsn9de6",
+        "Missing 'msh'": "298bbd7e09xxx8c672d04ba26de4p154bc9jsn9de6459d8a13",
+        "Invalid Chars": "298bbd7e09msh8c672d04ba26de4p154bc9jsn9de6459d8a1@"
+    }
+    
+    results = map(_CLIENT.quick_validate_api_key_format, sample_keys.values())
+    for key_type, result in zip(sample_keys, results):
+        status_emoji = "✅" if result['status'] == 'success' else "❌"
+        print(f"{status_emoji} {key_type}: {result['message']}")
+
+
+if __name__ == "__main__":
+    validate_sample_keys()
@@ -12,7 +12,6 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.browser_utils import (
-    BrowserManager, 
     get_browser_manager, 
     open_url_in_browser, 
     open_direct_file_link,
@@ -20,15 +19,26 @@ from utils.browser_utils import (
     display_browser_open_result
 )
 import platform
+import functools
+from functools import partial
+from types import MappingProxyType
+import pytest
+from _output import buffered_stdout
+
+@functools.lru_cache(maxsize=1)
+def _browsers():
+    """Browser list snapshot, taken on first use and shared by every test/summary below"""
+    return tuple(get_browser_manager().get_browser_list())
 
 def test_browser_manager():
     """Test BrowserManager initialization and browser detection"""
     print("🧪 Testing BrowserManager...")
     
-    manager = BrowserManager()
+    # Shared instance: browser detection runs once for the whole module
+    manager = get_browser_manager()
     
     # Test browser detection
-    browsers = manager.get_browser_list()
+    browsers = _browsers()
     print(f"✅ Detected {len(browsers)} browsers:")
     for browser in browsers:
         status = "Available" if browser['available'] else "Not Found"
@@ -63,52 +73,51 @@ def test_browser_opening():
     
     return True
 
-def test_file_link_opening():
+# Mock file info objects for different modes (read-only, built once)
+TEST_FILES = (
+    MappingProxyType({
+        'name': 'RapidAPI Test File',
+        'file_info': MappingProxyType({
+            'direct_link': 'https://example.com/rapidapi_file.mp4',
+            'file_name': 'test_video.mp4',
+            'download_link': 'https://example.com/rapidapi_file.mp4'
+        })
+    }),
+    MappingProxyType({
+        'name': 'Cookie Mode Test File', 
+        'file_info': MappingProxyType({
+            'download_link': 'https://example.com/cookie_file.pdf',
+            'file_name': 'test_document.pdf'
+        })
+    }),
+    MappingProxyType({
+        'name': 'Official API Test File',
+        'file_info': MappingProxyType({
+            'dlink': 'https://example.com/official_file.jpg',
+            'file_name': 'test_image.jpg',
+            'server_filename': 'test_image.jpg'
+        })
+    }),
+    MappingProxyType({
+        'name': 'Main App Test File',
+        'file_info': MappingProxyType({
+            'link': 'https://example.com/main_file.zip',
+            'name': 'test_archive.zip'
+        })
+    })
+)
+
+@pytest.mark.parametrize('case', TEST_FILES, ids=[case['name'] for case in TEST_FILES])
+def test_file_link_opening(case):
     """Test direct file link opening functionality"""
-    print("\n🧪 Testing direct file link opening...")
-    
-    # Mock file info objects for different modes
-    test_files = [
-        {
-            'name': 'RapidAPI Test File',
-            'file_info': {
-                'direct_link': 'https://example.com/rapidapi_file.mp4',
-                'file_name': 'test_video.mp4',
-                'download_link': 'https://example.com/rapidapi_file.mp4'
-            }
-        },
-        {
-            'name': 'Cookie Mode Test File', 
-            'file_info': {
-                'download_link': 'https://example.com/cookie_file.pdf',
-                'file_name': 'test_document.pdf'
-            }
-        },
-        {
-            'name': 'Official API Test File',
-            'file_info': {
-                'dlink': 'https://example.com/official_file.jpg',
-                'file_name': 'test_image.jpg',
-                'server_filename': 'test_image.jpg'
-            }
-        },
-        {
-            'name': 'Main App Test File',
-            'file_info': {
-                'link': 'https://example.com/main_file.zip',
-                'name': 'test_archive.zip'
-            }
-        }
-    ]
+    print(f"\n🧪 Testing direct file link opening: {case['name']}...")
     
-    for test in test_files:
-        print(f"Testing {test['name']}...")
-        result = open_direct_file_link(test['file_info'], browser='default')
-        print(f"   Result: {result['status']} - {result['message']}")
-        if 'file_name' in result:
-            print(f"   File: {result['file_name']}")
-        if 'link_type' in result:
-            print(f"   Link Type: {result['link_type']}")
+    result = open_direct_file_link(case['file_info'], browser='default')
+    print(f"   Result: {result['status']} - {result['message']}")
+    if 'file_name' in result:
+        print(f"   File: {result['file_name']}")
+    if 'link_type' in result:
+        print(f"   Link Type: {result['link_type']}")
     
     return True
 
@@ -119,16 +128,16 @@ def test_cross_platform_compatibility():
     system = platform.system().lower()
     print(f"✅ Running on: {system}")
     
-    manager = BrowserManager()
+    supported_browsers = get_browser_manager().supported_browsers
     
-    # Test browser path detection for current platform
-    for browser_id, browser_info in manager.supported_browsers.items():
-        if browser_id == 'default':
+    # Test browser detection results for current platform
+    for browser in _browsers():
+        if browser['id'] == 'default':
             continue
             
-        print(f"Testing {browser_info['name']}...")
-        if browser_info.get('command'):
-            print(f"   ✅ Found at: {browser_info['command']}")
+        print(f"Testing {browser['name']}...")
+        if browser['available']:
+            print(f"   ✅ Found at: {supported_browsers[browser['id']]['command']}")
         else:
             print(f"   ❌ Not found on this system")
     
@@ -154,52 +163,58 @@ def test_error_handling():
     
     return True
 
-def generate_implementation_summary():
+def generate_implementation_summary(browsers=None):
     """Generate a summary of what was implemented"""
-    print("\n📋 IMPLEMENTATION SUMMARY")
-    print("=" * 50)
-    
-    print("\n🔧 Created Components:")
-    print("• utils/browser_utils.py - Centralized browser management")
-    print("• BrowserManager class - Cross-platform browser detection")
-    print("• Browser opening functions with error handling")
-    print("• Streamlit UI integration functions")
-    
-    print("\n🌐 Enhanced Pages:")
-    print("• 💳 RapidAPI Mode - Added 'Open Direct File Link' buttons")
-    print("• 🍪 Cookie Mode - Added 'Open Direct File Link' buttons") 
-    print("• 📁 File Manager - Added 'Open Link' functionality")
-    print("• app.py - Added 'Open Link' buttons to file cards")
-    print("• ⚙️ Settings - Added Browser Settings tab")
-    
-    print("\n🔗 Supported Link Types:")
-    print("• direct_link (RapidAPI)")
-    print("• download_link (Cookie Mode)")
-    print("• dlink (Official API)")
-    print("• link (Alternative links)")
-    print("• url (Generic URLs)")
-    
-    print("\n🌍 Browser Support:")
-    manager = BrowserManager()
-    browsers = manager.get_browser_list()
-    for browser in browsers:
-        status = "✅" if browser['available'] else "❌"
-        print(f"• {status} {browser['name']} - {browser['description']}")
-    
-    print("\n📱 Features:")
-    print("• Cross-platform compatibility (Windows, macOS, Linux)")
-    print("• Browser preference persistence per session")
-    print("• Fallback to system default browser")
-    print("• Error handling with user feedback")
-    print("• Test functionality in Settings")
-    print("• Celebration effects on success")
-    
-    print("\n🎯 Integration Points:")
-    print("• Single file processing in all modes")
-    print("• Bulk file processing in RapidAPI/Cookie modes")
-    print("• File manager download operations")
-    print("• Main app file cards")
-    print("• Settings page for configuration and testing")
+    if browsers is None:
+        browsers = _browsers()
+    # Collect every line first and emit the whole summary with one write
+    lines = [
+        "\n📋 IMPLEMENTATION SUMMARY",
+        "=" * 50,
+        
+        "\n🔧 Created Components:",
+        "• utils/browser_utils.py - Centralized browser management",
+        "• BrowserManager class - Cross-platform browser detection",
+        "• Browser opening functions with error handling",
+        "• Streamlit UI integration functions",
+        
+        "\n🌐 Enhanced Pages:",
+        "• 💳 RapidAPI Mode - Added 'Open Direct File Link' buttons",
+        "• 🍪 Cookie Mode - Added 'Open Direct File Link' buttons",
+        "• 📁 File Manager - Added 'Open Link' functionality",
+        "• app.py - Added 'Open Link' buttons to file cards",
+        "• ⚙️ Settings - Added Browser Settings tab",
+        
+        "\n🔗 Supported Link Types:",
+        "• direct_link (RapidAPI)",
+        "• download_link (Cookie Mode)",
+        "• dlink (Official API)",
+        "• link (Alternative links)",
+        "• url (Generic URLs)",
+        
+        "\n🌍 Browser Support:"
+    ]
+    lines.extend(
+        f"• {'✅' if browser['available'] else '❌'} {browser['name']} - {browser['description']}"
+        for browser in browsers
+    )
+    lines.extend([
+        "\n📱 Features:",
+        "• Cross-platform compatibility (Windows, macOS, Linux)",
+        "• Browser preference persistence per session",
+        "• Fallback to system default browser",
+        "• Error handling with user feedback",
+        "• Test functionality in Settings",
+        "• Celebration effects on success",
+        
+        "\n🎯 Integration Points:",
+        "• Single file processing in all modes",
+        "• Bulk file processing in RapidAPI/Cookie modes",
+        "• File manager download operations",
+        "• Main app file cards",
+        "• Settings page for configuration and testing"
+    ])
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def main():
     """Run all tests"""
@@ -209,7 +224,7 @@ def main():
     tests = [
         test_browser_manager,
         test_browser_opening,
-        test_file_link_opening,
+        *(partial(test_file_link_opening, case) for case in TEST_FILES),
         test_cross_platform_compatibility,
         test_error_handling
     ]
@@ -237,4 +252,5 @@ def main():
     print("implemented across all modes of your TeraBox application!")
 
 if __name__ == "__main__":
-    main()
+    with buffered_stdout():
+        main()
@@ -8,8 +8,10 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.state_manager import StateManager, BatchStateUpdate
 from utils.ui_manager import UIManager
+from _output import buffered_stdout
+from _discovery import module_tests
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 
 class TestButtonInteractions(unittest.TestCase):
@@ -17,13 +19,14 @@ class TestButtonInteractions(unittest.TestCase):
     
     def setUp(self):
         """Set up test environment"""
-        # Mock streamlit session state
+        # Mock streamlit session state with a plain dict, patched once per test
         self.mock_session_state = {}
+        patcher = patch('streamlit.session_state', self.mock_session_state)
+        patcher.start()
+        self.addCleanup(patcher.stop)
         
-    @patch('streamlit.session_state', new_callable=lambda: Mock())
-    def test_state_manager_update(self, mock_st):
+    def test_state_manager_update(self):
         """Test StateManager updates without reruns"""
-        mock_st.session_state = self.mock_session_state
         
         # Test single state update
         StateManager.update_state('test_key', 'test_value')
@@ -37,28 +40,26 @@ class TestButtonInteractions(unittest.TestCase):
         }
         StateManager.update_multiple_states(updates)
         
-        for key, value in updates.items():
-            self.assertEqual(self.mock_session_state.get(key), value)
+        self.assertEqual({key: self.mock_session_state.get(key) for key in updates}, updates)
     
-    @patch('streamlit.session_state', new_callable=lambda: Mock())
-    def test_batch_state_update(self, mock_st):
+    def test_batch_state_update(self):
         """Test batch state updates"""
-        mock_st.session_state = self.mock_session_state
+        
+        expected = {
+            'batch_key1': 'batch_value1',
+            'batch_key2': 42,
+            'batch_key3': False
+        }
         
         with BatchStateUpdate() as batch:
-            batch.set('batch_key1', 'batch_value1')
-            batch.set('batch_key2', 42)
-            batch.set('batch_key3', False)
+            for key, value in expected.items():
+                batch.set(key, value)
         
         # Verify all values were set
-        self.assertEqual(self.mock_session_state.get('batch_key1'), 'batch_value1')
-        self.assertEqual(self.mock_session_state.get('batch_key2'), 42)
-        self.assertEqual(self.mock_session_state.get('batch_key3'), False)
+        self.assertEqual({key: self.mock_session_state.get(key) for key in expected}, expected)
     
-    @patch('streamlit.session_state', new_callable=lambda: Mock())
-    def test_state_clearing(self, mock_st):
+    def test_state_clearing(self):
         """Test state clearing without reruns"""
-        mock_st.session_state = self.mock_session_state
         
         # Set some initial values
         self.mock_session_state['clear_key1'] = 'value1'
@@ -69,14 +70,10 @@ class TestButtonInteractions(unittest.TestCase):
         StateManager.clear_state(['clear_key1', 'clear_key2'])
         
         # Verify keys were cleared but others remain
-        self.assertNotIn('clear_key1', self.mock_session_state)
-        self.assertNotIn('clear_key2', self.mock_session_state)
-        self.assertEqual(self.mock_session_state.get('keep_key'), 'keep_value')
+        self.assertEqual(self.mock_session_state, {'keep_key': 'keep_value'})
     
-    @patch('streamlit.session_state', new_callable=lambda: Mock())
-    def test_toggle_state(self, mock_st):
+    def test_toggle_state(self):
         """Test state toggling"""
-        mock_st.session_state = self.mock_session_state
         
         # Test toggling from default False
         result = StateManager.toggle_state('toggle_key')
@@ -90,22 +87,20 @@ class TestButtonInteractions(unittest.TestCase):
     
     def test_no_rerun_calls_in_state_manager(self):
         """Verify StateManager doesn't contain st.rerun() calls"""
+        import ast
         import inspect
+        from pathlib import Path
         from utils.state_manager import StateManager
         
-        # Get all methods of StateManager
-        methods = inspect.getmembers(StateManager, predicate=inspect.ismethod)
-        
-        for method_name, method in methods:
-            # Get source code of method
-            try:
-                source = inspect.getsource(method)
-                # Check that st.rerun() is not in the source
-                self.assertNotIn('st.rerun()', source, 
-                               f"Method {method_name} contains st.rerun() call")
-            except OSError:
-                # Skip if source is not available
-                pass
+        # One read + one parse of the whole module (also covers nested functions)
+        source_file = inspect.getsourcefile(StateManager)
+        tree = ast.parse(Path(source_file).read_text(encoding='utf-8'))
+        
+        rerun_lines = [
+            node.lineno for node in ast.walk(tree)
+            if isinstance(node, ast.Call) and getattr(node.func, 'attr', '') == 'rerun'
+        ]
+        self.assertFalse(rerun_lines, f"st.rerun() call(s) found in {source_file} at lines {rerun_lines}")
     
     def test_ui_manager_conditional_rendering(self):
         """Test UIManager conditional rendering"""
@@ -122,68 +117,68 @@ class TestButtonInteractions(unittest.TestCase):
 class TestButtonBehavior(unittest.TestCase):
     """Test specific button behaviors that were problematic"""
     
+    def setUp(self):
+        """Set up test environment"""
+        # Mock streamlit session state with a plain dict, patched once per test
+        self.mock_state = {}
+        patcher = patch('streamlit.session_state', self.mock_state)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
     def test_settings_save_behavior(self):
         """Test that settings save operations don't cause reruns"""
-        mock_state = {}
-        
-        with patch('streamlit.session_state', mock_state):
-            # Simulate saving general settings (old problematic behavior)
-            # This should NOT call st.rerun()
-            
-            # Instead of st.rerun(), we now use StateManager
-            StateManager.update_state('settings_saved', True, "Settings saved!")
-            
-            # Verify state was updated
-            self.assertTrue(mock_state.get('settings_saved'))
+        # Simulate saving general settings (old problematic behavior)
+        # This should NOT call st.rerun()
+        
+        # Instead of st.rerun(), we now use StateManager
+        StateManager.update_state('settings_saved', True, "Settings saved!")
+        
+        # Verify state was updated
+        self.assertTrue(self.mock_state.get('settings_saved'))
     
     def test_api_key_validation_behavior(self):
         """Test API key validation without reruns"""
-        mock_state = {}
-        
-        with patch('streamlit.session_state', mock_state):
-            # Simulate API key validation (old problematic behavior)
-            StateManager.update_multiple_states({
-                'rapidapi_client': 'mock_client',
-                'rapidapi_validated': True,
-                'current_rapidapi_key': 'test_key'
-            })
-            
-            # Verify all states were updated
-            self.assertEqual(mock_state.get('rapidapi_client'), 'mock_client')
-            self.assertTrue(mock_state.get('rapidapi_validated'))
-            self.assertEqual(mock_state.get('current_rapidapi_key'), 'test_key')
+        # Simulate API key validation (old problematic behavior)
+        StateManager.update_multiple_states({
+            'rapidapi_client': 'mock_client',
+            'rapidapi_validated': True,
+            'current_rapidapi_key': 'test_key'
+        })
+        
+        # Verify all states were updated
+        self.assertEqual(self.mock_state.get('rapidapi_client'), 'mock_client')
+        self.assertTrue(self.mock_state.get('rapidapi_validated'))
+        self.assertEqual(self.mock_state.get('current_rapidapi_key'), 'test_key')
     
     def test_cookie_clearing_behavior(self):
         """Test cookie clearing without reruns"""
-        mock_state = {
+        self.mock_state.update({
             'cookie_api': 'mock_api',
             'cookie_validated': True,
             'current_cookie': 'test_cookie'
-        }
-        
-        with patch('streamlit.session_state', mock_state):
-            # Simulate cookie clearing (old problematic behavior)
-            StateManager.update_multiple_states({
-                'cookie_api': None,
-                'cookie_validated': False,
-                'current_cookie': ''
-            })
-            
-            # Verify all states were cleared
-            self.assertIsNone(mock_state.get('cookie_api'))
-            self.assertFalse(mock_state.get('cookie_validated'))
-            self.assertEqual(mock_state.get('current_cookie'), '')
+        })
+        
+        # Simulate cookie clearing (old problematic behavior)
+        StateManager.update_multiple_states({
+            'cookie_api': None,
+            'cookie_validated': False,
+            'current_cookie': ''
+        })
+        
+        # Verify all states were cleared
+        self.assertIsNone(self.mock_state.get('cookie_api'))
+        self.assertFalse(self.mock_state.get('cookie_validated'))
+        self.assertEqual(self.mock_state.get('current_cookie'), '')
     
     def test_mode_switching_behavior(self):
         """Test mode switching without reruns"""
-        mock_state = {'api_mode': 'unofficial'}
-        
-        with patch('streamlit.session_state', mock_state):
-            # Simulate mode switching (old problematic behavior)
-            StateManager.update_state('api_mode', 'rapidapi')
-            
-            # Verify mode was switched
-            self.assertEqual(mock_state.get('api_mode'), 'rapidapi')
+        self.mock_state['api_mode'] = 'unofficial'
+        
+        # Simulate mode switching (old problematic behavior)
+        StateManager.update_state('api_mode', 'rapidapi')
+        
+        # Verify mode was switched
+        self.assertEqual(self.mock_state.get('api_mode'), 'rapidapi')
 
 
 def run_button_interaction_tests():
@@ -191,16 +186,12 @@ def run_button_interaction_tests():
     print("🧪 Running Button Interaction Tests...")
     print("=" * 50)
     
-    # Create test suite
-    loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-    
-    # Add test cases
-    suite.addTests(loader.loadTestsFromTestCase(TestButtonInteractions))
-    suite.addTests(loader.loadTestsFromTestCase(TestButtonBehavior))
+    # Select this module's tests from the shared (cached) discovery pass
+    suite = module_tests('test_button_interactions')
     
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
+    # Run tests (per-test output is only shown for failures); results go to
+    # stdout so they share the buffer with the header and summary
+    runner = unittest.TextTestRunner(stream=sys.stdout, verbosity=2, buffer=True)
     result = runner.run(suite)
     
     # Print summary
@@ -229,5 +220,6 @@ def run_button_interaction_tests():
 
 
 if __name__ == "__main__":
-    success = run_button_interaction_tests()
+    with buffered_stdout():
+        success = run_button_interaction_tests()
     sys.exit(0 if success else 1)
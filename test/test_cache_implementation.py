@@ -8,20 +8,36 @@ import sys
 import os
 import time
 import json
+import shutil
+import tempfile
 from typing import Dict, Any
 
 # Add the parent directory to the path so we can import our modules
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from terabox_rapidapi import TeraBoxRapidAPI
-from cache_manager import TeraBoxCacheManager
+from utils.terabox_rapidapi import TeraBoxRapidAPI
+from utils.cache_manager import TeraBoxCacheManager
+from _output import buffered_stdout
+
+# Scratch cache directory so tests never touch the real output/sessions cache;
+# created per run by setup_module() and removed again by teardown_module()
+TEST_CACHE_DIR = None
+
+def setup_module(module=None):
+    """Create the scratch cache directory (pytest hook, also used by main())"""
+    global TEST_CACHE_DIR
+    TEST_CACHE_DIR = tempfile.mkdtemp(prefix="teradl_cache_test_")
+
+def teardown_module(module=None):
+    """Remove the scratch cache directory and everything written to it"""
+    shutil.rmtree(TEST_CACHE_DIR, ignore_errors=True)
 
 def test_cache_manager():
     """Test the cache manager functionality"""
     print("🧪 Testing Cache Manager...")
     
     # Initialize cache manager
-    cache_mgr = TeraBoxCacheManager(cache_ttl_hours=1)  # 1 hour TTL for testing
+    cache_mgr = TeraBoxCacheManager(cache_dir=TEST_CACHE_DIR, cache_ttl_hours=1)  # 1 hour TTL for testing
     
     # Test URL extraction
     test_urls = [
@@ -32,11 +48,14 @@ def test_cache_manager():
     ]
     
     print("\n📋 Testing SURL extraction:")
-    for url in test_urls:
-        surl = cache_mgr._extract_surl_from_url(url)
-        print(f"  URL: {url}")
-        print(f"  SURL: {surl}")
-        print()
+    # The cache keys on _extract_surl_from_url; URLs without a surl fall back
+    # to a URL hash
+    surls = [cache_mgr._extract_surl_from_url(url) for url in test_urls]
+    sys.stdout.write("".join(
+        f"  URL: {url}\n  SURL: {surl}\n\n" for url, surl in zip(test_urls, surls)
+    ))
+    assert surls[:3] == ["12TX5ZJi1vCaNPXENFZIZjw", "1aBcDeFgHiJkL", "1XyZ123456"]
+    assert surls[3].startswith("hash_")
     
     # Test cache operations with mock data
     print("💾 Testing Cache Operations:")
@@ -103,8 +122,12 @@ def test_cache_expiry():
     """Test cache expiry functionality"""
     print("⏰ Testing Cache Expiry...")
     
+    # Simulated clock so expiry needs no real waiting
+    clock = [time.time()]
+    
     # Create cache manager with very short TTL (1 second for testing)
-    cache_mgr = TeraBoxCacheManager(cache_ttl_hours=1/3600)  # 1 second TTL
+    cache_mgr = TeraBoxCacheManager(cache_dir=TEST_CACHE_DIR, cache_ttl_hours=1/3600,  # 1 second TTL
+                                    time_fn=lambda: clock[0])
     
     test_url = "https://www.terabox.app/sharing/link?surl=expirytest123"
     mock_response = {
@@ -122,9 +145,9 @@ def test_cache_expiry():
     cached = cache_mgr.get_cached_response(test_url)
     print(f"  Immediate cache hit: {cached is not None}")
     
-    # Wait for expiry
-    print("  Waiting for cache to expire...")
-    time.sleep(2)
+    # Advance the clock past the TTL
+    print("  Advancing clock past TTL...")
+    clock[0] += 10
     
     # Should be expired now
     cached = cache_mgr.get_cached_response(test_url)
@@ -136,7 +159,7 @@ def test_cache_cleanup():
     """Test cache cleanup functionality"""
     print("🧹 Testing Cache Cleanup...")
     
-    cache_mgr = TeraBoxCacheManager()
+    cache_mgr = TeraBoxCacheManager(cache_dir=TEST_CACHE_DIR)
     
     # Create some test cache entries
     test_urls = [
@@ -152,9 +175,9 @@ def test_cache_cleanup():
         'sizebytes': 1048576
     }
     
-    # Save multiple entries
-    for url in test_urls:
-        cache_mgr.save_response_to_cache(url, mock_response)
+    # Save multiple entries in one batch
+    saved_count = cache_mgr.save_many({url: mock_response for url in test_urls})
+    print(f"  Entries saved: {saved_count}")
     
     # Get stats before cleanup
     stats_before = cache_mgr.get_cache_stats()
@@ -179,6 +202,7 @@ def main():
     print("🎯 TeraBox RapidAPI Cache Implementation Test Suite")
     print("=" * 60)
     
+    setup_module()
     try:
         # Test 1: Cache Manager
         cache_mgr = test_cache_manager()
@@ -210,9 +234,12 @@ def main():
         import traceback
         traceback.print_exc()
         return 1
+    finally:
+        teardown_module()
     
     return 0
 
 if __name__ == "__main__":
-    exit_code = main()
+    with buffered_stdout():
+        exit_code = main()
     sys.exit(exit_code)
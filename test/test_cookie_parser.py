@@ -12,20 +12,34 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 import re
 from typing import Dict
 
+# Cookie export columns are separated by tabs or runs of whitespace
+_FIELD_SPLIT_RE = re.compile(r'\t+|\s{2,}')
+
+# Important TeraBox cookies and session-related cookie names
+_IMPORTANT_COOKIES = frozenset(('ndus', 'BDUSS', 'STOKEN', 'csrfToken', 'lang'))
+_SESSION_COOKIES = frozenset(('sessionid', 'session', 'auth', 'token'))
+# Name fragments of TeraBox-related, bid (common in TeraBox) and stripe (payment) cookies
+_RELATED_COOKIE_RE = re.compile(r'terabox|1024|bid|stripe', re.IGNORECASE)
+_QUOTES = '"\''
+
 def parse_tabular_cookies(cookie_data: str) -> Dict[str, str]:
     """
     Parse cookies from tabular format (browser export format)
     """
-    cookies = {}
-    lines = cookie_data.strip().split('\n')
-    
-    for line in lines:
+    return dict(_iter_cookie_pairs(cookie_data))
+
+def _iter_cookie_pairs(cookie_data: str):
+    """Yield (name, value) for each usable line of tabular cookie data"""
+    for line in cookie_data.splitlines():
         line = line.strip()
         if not line:
             continue
             
-        # Split by tabs (most common) or multiple spaces
-        fields = re.split(r'\t+|\s{2,}', line)
+        # Split by tabs (most common) or multiple spaces; only name and value are used.
+        # Browser exports are single-tab separated, so try a plain split first.
+        fields = line.split('\t', 2)
+        if len(fields) < 2 or not fields[1]:
+            fields = _FIELD_SPLIT_RE.split(line, maxsplit=2)
         
         if len(fields) >= 2:
             cookie_name = fields[0].strip()
@@ -33,7 +47,35 @@ def parse_tabular_cookies(cookie_data: str) -> Dict[str, str]:
             
             # Skip empty names or values
             if cookie_name and cookie_value:
-                cookies[cookie_name] = cookie_value
+                yield cookie_name, cookie_value
+
+def parse_tabular_cookies_bytes(cookie_data: bytes) -> Dict[str, str]:
+    """
+    Parse cookies from tabular format read as raw bytes (e.g. an export file)
+    
+    Tabs and newlines are single ASCII bytes, so separators are found on the
+    bytes directly and only the name and value slices are decoded.
+    """
+    cookies = {}
+    
+    for line in cookie_data.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        
+        tab = line.find(b'\t')
+        end = line.find(b'\t', tab + 1)
+        if tab == -1 or end == tab + 1:
+            # Not single-tab separated - decode the line and use the regex split
+            cookies.update(_iter_cookie_pairs(line.decode('utf-8')))
+            continue
+        
+        cookie_name = line[:tab].strip().decode('utf-8')
+        cookie_value = (line[tab + 1:end] if end != -1 else line[tab + 1:]).strip().decode('utf-8')
+        
+        # Skip empty names or values
+        if cookie_name and cookie_value:
+            cookies[cookie_name] = cookie_value
     
     return cookies
 
@@ -41,29 +83,14 @@ def filter_terabox_cookies(cookies: Dict[str, str]) -> Dict[str, str]:
     """
     Filter cookies to get only TeraBox-relevant ones
     """
-    # Important TeraBox cookies
-    important_cookies = ['ndus', 'BDUSS', 'STOKEN', 'csrfToken', 'lang']
-    
-    # TeraBox domain patterns
-    terabox_domains = ['terabox.com', '1024terabox.com', 'terabox.app']
-    
     filtered = {}
     
     for name, value in cookies.items():
-        # Include important cookies regardless of domain
-        if name in important_cookies:
-            filtered[name] = value
-        # Include cookies that might be TeraBox related
-        elif any(domain in name.lower() for domain in ['terabox', '1024']):
-            filtered[name] = value
-        # Include session-related cookies
-        elif name.lower() in ['sessionid', 'session', 'auth', 'token']:
-            filtered[name] = value
-        # Include bid cookies (common in TeraBox)
-        elif 'bid' in name.lower():
-            filtered[name] = value
-        # Include stripe cookies (payment-related)
-        elif 'stripe' in name.lower():
+        # Include important cookies regardless of domain, cookies that might be
+        # TeraBox related (including bid and stripe cookies) and session cookies
+        if (name in _IMPORTANT_COOKIES
+                or _RELATED_COOKIE_RE.search(name)
+                or name.lower() in _SESSION_COOKIES):
             filtered[name] = value
     
     return filtered
@@ -72,13 +99,8 @@ def format_cookie_string(cookies: Dict[str, str]) -> str:
     """
     Format cookies dictionary into a proper cookie string
     """
-    cookie_pairs = []
-    for name, value in cookies.items():
-        # Clean the value (remove quotes if present)
-        clean_value = value.strip('"\'')
-        cookie_pairs.append(f"{name}={clean_value}")
-    
-    return "; ".join(cookie_pairs)
+    # Clean each value (remove quotes if present)
+    return "; ".join(f"{name}={value.strip(_QUOTES)}" for name, value in cookies.items())
 
 def test_with_provided_data():
     """Test with the data provided by the user"""
@@ -105,10 +127,14 @@ __stripe_sid	18df916d-6beb-4558-b410-caa96cd57f1a2941b5	.dm.1024terabox.com	/	20
     all_cookies = parse_tabular_cookies(sample_data)
     print(f"✅ Parsed {len(all_cookies)} total cookies")
     
+    # The bytes parser must agree with the text parser
+    assert parse_tabular_cookies_bytes(sample_data.encode('utf-8')) == all_cookies
+    
     # Show all cookies
     print("\nAll parsed cookies:")
-    for name, value in all_cookies.items():
-        print(f"  {name}: {value[:50]}{'...' if len(value) > 50 else ''}")
+    print("\n".join(
+        f"  {name}: {value[:50]}{'...' if len(value) > 50 else ''}" for name, value in all_cookies.items()
+    ))
     
     print("\n2. Filtering TeraBox-relevant cookies...")
     
@@ -118,8 +144,9 @@ __stripe_sid	18df916d-6beb-4558-b410-caa96cd57f1a2941b5	.dm.1024terabox.com	/	20
     
     # Show filtered cookies
     print("\nTeraBox-relevant cookies:")
-    for name, value in terabox_cookies.items():
-        print(f"  {name}: {value[:50]}{'...' if len(value) > 50 else ''}")
+    print("\n".join(
+        f"  {name}: {value[:50]}{'...' if len(value) > 50 else ''}" for name, value in terabox_cookies.items()
+    ))
     
     print("\n3. Formatting cookie string...")
     
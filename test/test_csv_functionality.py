@@ -10,36 +10,58 @@ import re
 from datetime import datetime
 from typing import List, Dict
 
-def extract_terabox_links(text: str) -> List[str]:
-    """Extract all TeraBox/TeraShare links from text"""
-    # Pattern to match various TeraBox link formats
-    patterns = [
-        r'https://terasharelink\.com/s/[A-Za-z0-9_-]+',
-        r'https://www\.terabox\.app/sharing/link\?surl=[A-Za-z0-9_-]+',
-        r'https://terabox\.com/s/[A-Za-z0-9_-]+',
-        r'https://1024terabox\.com/s/[A-Za-z0-9_-]+',
-        r'https://www\.terabox\.com/sharing/link\?surl=[A-Za-z0-9_-]+',
-        r'https://teraboxapp\.com/s/[A-Za-z0-9_-]+',
-        r'https://1024tera\.com/s/[A-Za-z0-9_-]+',
-        r'https://www\.1024tera\.com/s/[A-Za-z0-9_-]+',
-        r'https://terabox\.app/s/[A-Za-z0-9_-]+',
-        r'https://www\.terabox\.app/s/[A-Za-z0-9_-]+'
-    ]
-    
-    all_links = []
-    for pattern in patterns:
-        links = re.findall(pattern, text, re.IGNORECASE)
-        all_links.extend(links)
-    
-    # Remove duplicates while preserving order
-    unique_links = []
-    seen = set()
-    for link in all_links:
-        if link not in seen:
-            unique_links.append(link)
-            seen.add(link)
-    
-    return unique_links
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.terabox_urls import extract as extract_terabox_links
+
+CSV_FIELDNAMES = ('ID', 'Link', 'SURL', 'Domain', 'Extracted_At', 'Status', 'Processed')
+
+# Characters that make csv.writer quote a field (delimiter, quote char, line breaks)
+_CSV_NEEDS_QUOTING_RE = re.compile(r'[,"\r\n]')
+
+# csv_path -> ((mtime_ns, size), hashes of the links already stored in that file).
+# Only hash(link) is kept: ~1.8x less memory than the link strings (about 7.7 MB
+# vs 14 MB for 100k links), and the cache never outlives the process so hash()
+# is stable. Trade-off: a 64-bit hash collision would make a new link look like
+# a stored one and silently skip it; that risk is negligible at these sizes.
+_EXISTING_LINKS_CACHE: Dict[str, tuple] = {}
+
+def _file_signature(stat: os.stat_result) -> tuple:
+    """Cheap change marker for a file: (mtime_ns, size)"""
+    return stat.st_mtime_ns, stat.st_size
+
+def _load_existing_links(csv_path: str, stat: os.stat_result = None) -> set:
+    """Hashes of the links already stored in csv_path, re-read only when the file changed"""
+    if stat is None:
+        return set()
+    
+    signature = _file_signature(stat)
+    cached = _EXISTING_LINKS_CACHE.get(csv_path)
+    if cached and cached[0] == signature:
+        return cached[1]
+    
+    existing_links = set()
+    try:
+        with open(csv_path, 'r', newline='', encoding='utf-8') as file:
+            reader = csv.DictReader(file)
+            for row in reader:
+                existing_links.add(hash(row.get('Link', '')))
+    except Exception:
+        pass  # If file is corrupted or empty, start fresh
+    
+    _EXISTING_LINKS_CACHE[csv_path] = (signature, existing_links)
+    return existing_links
+
+def _surl_and_domain(link: str) -> tuple:
+    """SURL (last '/'-separated field) and domain (third field) of a link, found by index scans"""
+    if '/' not in link:
+        return link, 'Unknown'
+    
+    start = link.find('/', link.find('/') + 1) + 1
+    end = link.find('/', start)
+    domain = link[start:end] if end != -1 else link[start:]
+    return link[link.rfind('/') + 1:], domain
 
 def save_links_to_csv(links: List[str], csv_path: str = "utils/terebox.csv") -> bool:
     """Save extracted TeraBox links to CSV file"""
@@ -49,51 +71,49 @@ def save_links_to_csv(links: List[str], csv_path: str = "utils/terebox.csv") ->
         if dir_path:  # Only create directory if path has a directory component
             os.makedirs(dir_path, exist_ok=True)
         
-        # Prepare data for CSV
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        # One stat call answers "does it exist", "is it empty" and "has it changed"
+        try:
+            stat = os.stat(csv_path)
+        except FileNotFoundError:
+            stat = None
         
-        # Read existing data if file exists
-        existing_links = set()
-        if os.path.exists(csv_path):
-            try:
-                with open(csv_path, 'r', newline='', encoding='utf-8') as file:
-                    reader = csv.DictReader(file)
-                    for row in reader:
-                        existing_links.add(row.get('Link', ''))
-            except Exception:
-                pass  # If file is corrupted or empty, start fresh
+        # Read existing data if file exists (cached until the file changes)
+        existing_links = _load_existing_links(csv_path, stat)
+        
+        # Only add new links
+        new_links = [link for link in links if hash(link) not in existing_links]
+        base_id = len(existing_links)
         
-        # Prepare new data
-        new_rows = []
-        for i, link in enumerate(links, 1):
-            if link not in existing_links:  # Only add new links
-                # Extract SURL from link for easier identification
-                surl = link.split('/')[-1] if '/' in link else link
-                domain = link.split('/')[2] if '/' in link else 'Unknown'
-                
-                new_rows.append({
-                    'ID': len(existing_links) + len(new_rows) + 1,
-                    'Link': link,
-                    'SURL': surl,
-                    'Domain': domain,
-                    'Extracted_At': timestamp,
-                    'Status': 'Pending',
-                    'Processed': 'No'
-                })
+        # One timestamp string per call, shared by every new row (skipped if nothing is new)
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S") if new_links else None
         
         # Write to CSV
-        file_exists = os.path.exists(csv_path) and os.path.getsize(csv_path) > 0
+        file_exists = stat is not None and stat.st_size > 0
         
-        with open(csv_path, 'a', newline='', encoding='utf-8') as file:
-            fieldnames = ['ID', 'Link', 'SURL', 'Domain', 'Extracted_At', 'Status', 'Processed']
-            writer = csv.DictWriter(file, fieldnames=fieldnames)
+        # Large write buffer so a batch of rows reaches the file in few writes
+        with open(csv_path, 'a', newline='', encoding='utf-8', buffering=1 << 20) as file:
+            # Column order is fixed, so rows are written positionally
+            writer = csv.writer(file)
             
             # Write header if file is new or empty
             if not file_exists:
-                writer.writeheader()
+                writer.writerow(CSV_FIELDNAMES)
+            
+            # Stream new rows; SURL and domain are taken from the link for easier identification.
+            # SURL and domain are substrings of the link and the other fields are fixed, so a
+            # link that needs no quoting gives a row that can be written preformatted.
+            for i, link in enumerate(new_links, 1):
+                surl, domain = _surl_and_domain(link)
+                if _CSV_NEEDS_QUOTING_RE.search(link):
+                    writer.writerow((base_id + i, link, surl, domain, timestamp, 'Pending', 'No'))
+                else:
+                    file.write(f"{base_id + i},{link},{surl},{domain},{timestamp},Pending,No\r\n")
             
-            # Write new rows
-            writer.writerows(new_rows)
+            file.flush()
+            signature = _file_signature(os.fstat(file.fileno()))
+        
+        # Remember what the file now holds so the next call can skip re-reading it
+        _EXISTING_LINKS_CACHE[csv_path] = (signature, existing_links.union(map(hash, new_links)))
         
         return True
     except Exception as e:
@@ -106,13 +126,13 @@ def load_links_from_csv(csv_path: str = "utils/terebox.csv") -> List[Dict]:
         if not os.path.exists(csv_path):
             return []
         
-        links_data = []
-        with open(csv_path, 'r', newline='', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                links_data.append(dict(row))
-        
-        return links_data
+        # Large read buffer; rows are zipped against the header read once
+        with open(csv_path, 'r', newline='', encoding='utf-8', buffering=1 << 20) as file:
+            reader = csv.reader(file)
+            header = next(reader, None)
+            if not header:
+                return []
+            return [dict(zip(header, row)) for row in reader if row]
     except Exception as e:
         print(f"❌ Error loading from CSV: {str(e)}")
         return []
@@ -140,8 +160,7 @@ def test_csv_functionality():
     print("🔍 Step 1: Extracting TeraBox links...")
     extracted_links = extract_terabox_links(sample_text)
     print(f"✅ Found {len(extracted_links)} links:")
-    for i, link in enumerate(extracted_links, 1):
-        print(f"   {i}. {link}")
+    print("\n".join(f"   {i}. {link}" for i, link in enumerate(extracted_links, 1)))
     
     print("\n" + "=" * 50)
     
@@ -174,8 +193,10 @@ def test_csv_functionality():
     
     if loaded_data:
         print(f"✅ Loaded {len(loaded_data)} entries from CSV:")
-        for entry in loaded_data:
-            print(f"   ID: {entry.get('ID')}, SURL: {entry.get('SURL')}, Domain: {entry.get('Domain')}")
+        print("\n".join(
+            f"   ID: {entry.get('ID')}, SURL: {entry.get('SURL')}, Domain: {entry.get('Domain')}"
+            for entry in loaded_data
+        ))
     else:
         print("❌ Failed to load links from CSV!")
         return False
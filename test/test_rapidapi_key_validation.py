@@ -6,6 +6,8 @@ and live API testing functionality in the TeraBox RapidAPI integration.
 """
 
 import unittest
+import pytest
+from collections import namedtuple
 from unittest.mock import Mock, patch, MagicMock
 import sys
 import os
@@ -15,20 +17,44 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from utils.terabox_rapidapi import TeraBoxRapidAPI
 
+# Independent, read-only tests: safe to shard with pytest-xdist (see conftest.py)
+pytestmark = pytest.mark.xdist_group("rapidapi")
+
+
+# The live check only reads status_code, so a namedtuple stands in for requests.Response
+FakeResponse = namedtuple('FakeResponse', 'status_code')
+
+
+def _stub_session(**get_behaviour):
+    """Stand-in for requests.Session whose get() is a Mock configured by get_behaviour"""
+    return Mock(get=Mock(**get_behaviour), headers={})
+
 
 class TestRapidAPIKeyValidation(unittest.TestCase):
     """Test cases for RapidAPI key validation functionality"""
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.client = TeraBoxRapidAPI()
-        
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures once for the class"""
         # Valid test keys (format-wise)
-        self.valid_key_1 = "298bbd7e09msh8c672d04ba26de4p154bc9jsn9de6459d8a13"
-        self.valid_key_2 = "abcd1234efmsh567890abcdef123456p789abcjsn123456789"
+        cls.valid_key_1 = "298bbd7e09msh8c672d04ba26de4p154bc9jsn9de6459d8a13"
+        cls.valid_key_2 = "abcd1234efmsh567890abcdef123456p789abcjsn123456789"
+        
+        # Clients shared by every test that does not patch the HTTP session;
+        # format validation never mutates them
+        cls.client = TeraBoxRapidAPI()
+        cls.client_valid = TeraBoxRapidAPI(cls.valid_key_1)
+        # Explicitly empty key, overriding any key from the config
+        cls.empty_client = TeraBoxRapidAPI("")
+        
+        # Valid key with one invalid character spliced in, built once per class
+        cls.mutated_keys = tuple(
+            (char, cls.valid_key_1[:25] + char + cls.valid_key_1[26:])
+            for char in '@#$%^&*()-+='
+        )
         
         # Invalid test keys
-        self.invalid_keys = {
+        cls.invalid_keys = {
             'too_short': "298bbd7e09msh8c672d04ba26de4p154bc9jsn9de6",
             'too_long': "298bbd7e09msh8c672d04ba26de4p154bc9jsn9de6459d8a13extra",
             'missing_msh': "298bbd7e09xxx8c672d04ba26de4p154bc9jsn9de6459d8a13",
@@ -38,6 +64,22 @@ class TestRapidAPIKeyValidation(unittest.TestCase):
             'empty': "",
             'none': None
         }
+        
+        # Invalid keys ordered by length (None last) so consecutive validator
+        # calls take the same length branch
+        cls.invalid_keys_by_length = tuple(sorted(
+            cls.invalid_keys.items(),
+            key=lambda item: (item[1] is None, len(item[1] or ''))
+        ))
+        
+        # Lowercase fragment each invalid key's error message must contain
+        cls.expected_message_fragments = {
+            'too_short': 'length',
+            'too_long': 'length',
+            'missing_msh': 'msh',
+            'missing_jsn': 'jsn',
+            'special_chars': 'invalid characters'
+        }
     
     def test_valid_api_key_format(self):
         """Test validation of correctly formatted API keys"""
@@ -52,21 +94,16 @@ class TestRapidAPIKeyValidation(unittest.TestCase):
     
     def test_invalid_api_key_formats(self):
         """Test validation of incorrectly formatted API keys"""
-        for key_name, invalid_key in self.invalid_keys.items():
+        for key_name, invalid_key in self.invalid_keys_by_length:
             with self.subTest(key_type=key_name):
                 result = self.client._validate_api_key_format(invalid_key)
                 self.assertEqual(result['status'], 'failed')
                 self.assertIn('message', result)
                 
-                # Check specific error messages
-                if key_name == 'too_short' or key_name == 'too_long':
-                    self.assertIn('length', result['message'].lower())
-                elif key_name == 'missing_msh':
-                    self.assertIn('msh', result['message'].lower())
-                elif key_name == 'missing_jsn':
-                    self.assertIn('jsn', result['message'].lower())
-                elif key_name == 'special_chars':
-                    self.assertIn('invalid characters', result['message'].lower())
+                # Check specific error messages (message lowercased once)
+                expected_fragment = self.expected_message_fragments.get(key_name)
+                if expected_fragment:
+                    self.assertIn(expected_fragment, result['message'].lower())
     
     def test_api_key_length_validation(self):
         """Test specific length validation requirements"""
@@ -119,55 +156,45 @@ class TestRapidAPIKeyValidation(unittest.TestCase):
             if invalid_key is not None:  # Skip None test for boolean method
                 self.assertFalse(self.client.is_valid_api_key_format(invalid_key))
     
-    @patch('utils.terabox_rapidapi.requests.Session.get')
-    def test_live_api_validation_success(self, mock_get):
+    def test_live_api_validation_success(self):
         """Test successful live API validation"""
         # Mock successful response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_get.return_value = mock_response
+        session = _stub_session(return_value=FakeResponse(status_code=200))
         
-        client = TeraBoxRapidAPI(self.valid_key_1)
+        client = TeraBoxRapidAPI(self.valid_key_1, session=session)
         result = client._test_api_key_live()
         
         self.assertEqual(result['status'], 'success')
         self.assertIn('authentication successful', result['message'].lower())
     
-    @patch('utils.terabox_rapidapi.requests.Session.get')
-    def test_live_api_validation_unauthorized(self, mock_get):
+    def test_live_api_validation_unauthorized(self):
         """Test live API validation with unauthorized response"""
         # Mock unauthorized response
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_get.return_value = mock_response
+        session = _stub_session(return_value=FakeResponse(status_code=401))
         
-        client = TeraBoxRapidAPI(self.valid_key_1)
+        client = TeraBoxRapidAPI(self.valid_key_1, session=session)
         result = client._test_api_key_live()
         
         self.assertEqual(result['status'], 'failed')
         self.assertIn('authentication failed', result['message'].lower())
     
-    @patch('utils.terabox_rapidapi.requests.Session.get')
-    def test_live_api_validation_rate_limit(self, mock_get):
+    def test_live_api_validation_rate_limit(self):
         """Test live API validation with rate limit response"""
         # Mock rate limit response
-        mock_response = Mock()
-        mock_response.status_code = 429
-        mock_get.return_value = mock_response
+        session = _stub_session(return_value=FakeResponse(status_code=429))
         
-        client = TeraBoxRapidAPI(self.valid_key_1)
+        client = TeraBoxRapidAPI(self.valid_key_1, session=session)
         result = client._test_api_key_live()
         
         self.assertEqual(result['status'], 'warning')
         self.assertIn('rate limit', result['message'].lower())
     
-    @patch('utils.terabox_rapidapi.requests.Session.get')
-    def test_live_api_validation_network_error(self, mock_get):
+    def test_live_api_validation_network_error(self):
         """Test live API validation with network error"""
         # Mock network error
-        mock_get.side_effect = Exception("Network error")
+        session = _stub_session(side_effect=Exception("Network error"))
         
-        client = TeraBoxRapidAPI(self.valid_key_1)
+        client = TeraBoxRapidAPI(self.valid_key_1, session=session)
         result = client._test_api_key_live()
         
         self.assertEqual(result['status'], 'warning')
@@ -203,17 +230,15 @@ class TestRapidAPIKeyValidation(unittest.TestCase):
     def test_get_api_key_info(self):
         """Test API key information retrieval"""
         # Test with valid key
-        client = TeraBoxRapidAPI(self.valid_key_1)
-        info = client.get_api_key_info()
+        info = self.client_valid.get_api_key_info()
         
         self.assertTrue(info['configured'])
         self.assertEqual(info['length'], 50)
         self.assertTrue(info['format_valid'])
         self.assertIn('masked_key', info)
         
-        # Test with no key - need to override the config key
-        client_no_key = TeraBoxRapidAPI("")
-        info_no_key = client_no_key.get_api_key_info()
+        # Test with no key - the shared empty client overrides the config key
+        info_no_key = self.empty_client.get_api_key_info()
         
         self.assertFalse(info_no_key['configured'])
         self.assertIn('message', info_no_key)
@@ -241,12 +266,8 @@ class TestRapidAPIKeyValidation(unittest.TestCase):
     
     def test_character_validation(self):
         """Test validation of allowed characters"""
-        # Test with various invalid characters
-        invalid_chars = ['@', '#', '$', '%', '^', '&', '*', '(', ')', '-', '+', '=']
-        
-        for char in invalid_chars:
-            # Insert invalid character into a valid key format
-            invalid_key = self.valid_key_1[:25] + char + self.valid_key_1[26:]
+        # Valid key format with each invalid character inserted (see setUpClass)
+        for char, invalid_key in self.mutated_keys:
             with self.subTest(char=char):
                 result = self.client._validate_api_key_format(invalid_key)
                 self.assertEqual(result['status'], 'failed')
@@ -256,9 +277,12 @@ class TestRapidAPIKeyValidation(unittest.TestCase):
 class TestRapidAPIKeyValidationIntegration(unittest.TestCase):
     """Integration tests for RapidAPI key validation"""
     
-    def setUp(self):
-        """Set up integration test fixtures"""
-        self.valid_key = "298bbd7e09msh8c672d04ba26de4p154bc9jsn9de6459d8a13"
+    @classmethod
+    def setUpClass(cls):
+        """Set up integration test fixtures once for the class"""
+        cls.valid_key = "298bbd7e09msh8c672d04ba26de4p154bc9jsn9de6459d8a13"
+        # Format validation does not depend on the client's own key
+        cls.empty_client = TeraBoxRapidAPI("")
     
     @patch('utils.terabox_rapidapi.requests.Session')
     def test_client_initialization_with_validation(self, mock_session):
@@ -277,22 +301,23 @@ class TestRapidAPIKeyValidationIntegration(unittest.TestCase):
     
     def test_validation_error_messages_user_friendly(self):
         """Test that validation error messages are user-friendly"""
+        # Expected fragments are lowercased once, up front
         test_cases = [
-            ("short", "Invalid API key length"),
-            ("298bbd7e09xxx8c672d04ba26de4p154bc9jsn9de6459d8a13", "msh"),
-            ("298bbd7e09msh8c672d04ba26de4p154bc9xxx9de6459d8a13", "jsn"),
-            ("298bbd7e09msh8c672d04ba26de4p154bc9jsn9de6459d8a1@", "invalid characters")
+            (invalid_key, expected_in_message.lower()) for invalid_key, expected_in_message in (
+                ("short", "Invalid API key length"),
+                ("298bbd7e09xxx8c672d04ba26de4p154bc9jsn9de6459d8a13", "msh"),
+                ("298bbd7e09msh8c672d04ba26de4p154bc9xxx9de6459d8a13", "jsn"),
+                ("298bbd7e09msh8c672d04ba26de4p154bc9jsn9de6459d8a1@", "invalid characters")
+            )
         ]
         
-        client = TeraBoxRapidAPI()
-        
         for invalid_key, expected_in_message in test_cases:
             with self.subTest(key=invalid_key[:20] + "..."):
-                result = client._validate_api_key_format(invalid_key)
+                result = self.empty_client._validate_api_key_format(invalid_key)
                 self.assertEqual(result['status'], 'failed')
-                self.assertIn(expected_in_message.lower(), result['message'].lower())
+                self.assertIn(expected_in_message, result['message'].lower())
 
 
 if __name__ == '__main__':
     # Run the tests
-    unittest.main(verbosity=2)
+    unittest.main(verbosity=2, buffer=True)
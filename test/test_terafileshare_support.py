@@ -23,35 +23,57 @@ Test Data:
 import unittest
 import sys
 import os
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-# Import from RapidAPI mode page (using importlib for Unicode filename)
+import functools
+import importlib
 import importlib.util
-import sys
+import pytest
 
-# Load the RapidAPI mode module
-rapidapi_mode_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'pages', 'RapidAPI_Mode.py')
-spec = importlib.util.spec_from_file_location("rapidapi_mode", rapidapi_mode_path)
-rapidapi_mode = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(rapidapi_mode)
+# Add parent directory to path for imports
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
 
-# Import functions from the module
-extract_terabox_links = rapidapi_mode.extract_terabox_links
-_validate_terabox_link = rapidapi_mode._validate_terabox_link
-_get_pattern_description = rapidapi_mode._get_pattern_description
 from utils.terabox_rapidapi import TeraBoxRapidAPI
 from utils.config import validate_terabox_url
+from utils.rapidapi_utils import (
+    TERAFILESHARE_PATTERN,
+    validate_terabox_link_enhanced,
+    _get_pattern_description
+)
 import re
 
+# Independent, read-only tests: safe to shard with pytest-xdist (see conftest.py)
+pytestmark = pytest.mark.xdist_group("rapidapi")
+
+
+@functools.lru_cache(maxsize=None)
+def _load_rapidapi_mode():
+    """Import the RapidAPI mode page once, on first use rather than at collection"""
+    try:
+        # Regular import goes through sys.modules, so repeat loads are free
+        return importlib.import_module('pages.RapidAPI_Mode')
+    except ImportError:
+        # Fall back to loading the page file directly
+        rapidapi_mode_path = os.path.join(ROOT, 'pages', 'RapidAPI_Mode.py')
+        spec = importlib.util.spec_from_file_location("rapidapi_mode", rapidapi_mode_path)
+        rapidapi_mode = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(rapidapi_mode)
+        return rapidapi_mode
+
+
 class TestTeraFileShareSupport(unittest.TestCase):
     """Test suite for terafileshare.com domain support"""
     
-    def setUp(self):
-        """Set up test data and fixtures"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up immutable test data and fixtures once for the class"""
+        # Link extraction comes from the lazily imported page module
+        extract_terabox_links = _load_rapidapi_mode().extract_terabox_links
+        cls.extract_terabox_links = staticmethod(extract_terabox_links)
+        cls._validate_terabox_link = staticmethod(validate_terabox_link_enhanced)
+        cls._get_pattern_description = staticmethod(_get_pattern_description)
+        
         # Sample text with terafileshare.com links (from user's example)
-        self.sample_text = """
+        cls.sample_text = """
         N v vd:
         Click and watch 👇👇
         🔴𝗢𝗽𝗲𝗻 𝗟𝗶𝗻𝗸 & 👀𝗪𝗮𝘁𝗰𝗵 𝗼𝗻𝗹𝗶𝗻𝗲 + 𝗱𝗼𝘄𝗻𝗹𝗼𝗮𝗱👇👇
@@ -75,15 +97,19 @@ class TestTeraFileShareSupport(unittest.TestCase):
         """
         
         # Expected terafileshare.com links
-        self.expected_links = [
+        cls.expected_links = [
             "https://terafileshare.com/s/1S5IozLFWSGzbH1P8kxCpGw",
             "https://terafileshare.com/s/17eInWzo2JM-AQxo6AKmzxQ", 
             "https://terafileshare.com/s/1Br3eNFcGkByLPTNNXG42Eg",
             "https://terafileshare.com/s/1ISoEh2nxeYpYoI_yxEnSfg"
         ]
+        cls.EXPECTED_SET = frozenset(cls.expected_links)
+        
+        # Extraction is pure over the text, so run the pattern sweep once per class
+        cls._extracted_once = tuple(extract_terabox_links(cls.sample_text))
         
         # Test URLs for validation
-        self.test_urls = [
+        cls.test_urls = [
             "https://terafileshare.com/s/1S5IozLFWSGzbH1P8kxCpGw",
             "https://www.terafileshare.com/s/1234567890",
             "https://terafileshare.com/s/test-link_123",
@@ -95,8 +121,9 @@ class TestTeraFileShareSupport(unittest.TestCase):
         """Test that terafileshare.com links are properly extracted"""
         print("\n🧪 Testing TeraFileShare link extraction...")
         
-        # Extract links from sample text
-        extracted_links = extract_terabox_links(self.sample_text)
+        # Links extracted from sample text (computed once in setUpClass)
+        extracted_links = self._extracted_once
+        extracted_set = set(extracted_links)
         
         # Filter for terafileshare.com links
         terafileshare_links = [link for link in extracted_links if 'terafileshare.com' in link]
@@ -104,17 +131,16 @@ class TestTeraFileShareSupport(unittest.TestCase):
         print(f"📊 Extraction results:")
         print(f"   Total links extracted: {len(extracted_links)}")
         print(f"   TeraFileShare links: {len(terafileshare_links)}")
-        print(f"   Expected links: {len(set(self.expected_links))}")
+        print(f"   Expected links: {len(self.EXPECTED_SET)}")
         
-        # Verify all expected links were found
-        for expected_link in set(self.expected_links):
-            self.assertIn(expected_link, extracted_links, 
-                         f"Expected link not found: {expected_link}")
-            print(f"   ✅ Found: {expected_link}")
+        # Verify all expected links were found (one set difference, reported once)
+        missing = self.EXPECTED_SET - extracted_set
+        self.assertFalse(missing, f"Expected links not found: {sorted(missing)}")
+        print(f"   ✅ Found all {len(self.EXPECTED_SET)} expected links")
         
         # Verify no duplicates
-        unique_terafileshare = list(set(terafileshare_links))
-        self.assertEqual(len(unique_terafileshare), len(set(self.expected_links)),
+        unique_terafileshare = set(terafileshare_links)
+        self.assertEqual(len(unique_terafileshare), len(self.EXPECTED_SET),
                         "Duplicate links detected or missing links")
         
         print("✅ Link extraction test passed!")
@@ -123,19 +149,23 @@ class TestTeraFileShareSupport(unittest.TestCase):
         """Test link validation for terafileshare.com URLs"""
         print("\n🔍 Testing TeraFileShare link validation...")
         
-        for i, url in enumerate(self.test_urls):
-            validation_result = _validate_terabox_link(url)
-            
-            if i < 3:  # First 3 should be valid
-                self.assertTrue(validation_result['valid'], 
-                               f"Valid URL rejected: {url}")
-                self.assertEqual(validation_result['domain'], 
-                               'terafileshare.com' if 'www.' not in url else 'www.terafileshare.com')
-                print(f"   ✅ Valid: {url}")
-            else:  # Last 2 should be invalid
-                self.assertFalse(validation_result['valid'], 
-                                f"Invalid URL accepted: {url}")
-                print(f"   ❌ Invalid: {url} - {validation_result['reason']}")
+        # Validate every URL up front, then assert on the whole batch:
+        # the first 3 should be valid, the last 2 invalid
+        results = [self._validate_terabox_link(url) for url in self.test_urls]
+        valid_flags = [result['valid'] for result in results]
+        self.assertEqual(valid_flags, [True, True, True, False, False],
+                         f"Unexpected validation results: {dict(zip(self.test_urls, valid_flags))}")
+        
+        valid_urls = self.test_urls[:3]
+        self.assertEqual(
+            [result['domain'] for result in results[:3]],
+            ['terafileshare.com' if 'www.' not in url else 'www.terafileshare.com' for url in valid_urls]
+        )
+        
+        print("\n".join(
+            [f"   ✅ Valid: {url}" for url in valid_urls] +
+            [f"   ❌ Invalid: {url} - {result['reason']}" for url, result in zip(self.test_urls[3:], results[3:])]
+        ))
         
         print("✅ Link validation test passed!")
     
@@ -174,9 +204,8 @@ class TestTeraFileShareSupport(unittest.TestCase):
         """Test pattern description generation for new domain"""
         print("\n📝 Testing pattern descriptions...")
         
-        # Test pattern that should match terafileshare
-        terafileshare_pattern = r'https://terafileshare\.com/s/[A-Za-z0-9_-]+'
-        description = _get_pattern_description(terafileshare_pattern, 0)
+        # Built-in pattern that should match terafileshare
+        description = self._get_pattern_description(TERAFILESHARE_PATTERN, 0)
         
         self.assertEqual(description, "TeraFile Share Links",
                         f"Incorrect pattern description: {description}")
@@ -205,12 +234,15 @@ class TestTeraFileShareSupport(unittest.TestCase):
         """Test comprehensive text processing with real user data"""
         print("\n📝 Testing comprehensive text processing...")
         
-        # Extract links from the full sample text
-        extracted_links = extract_terabox_links(self.sample_text)
+        # Links extracted from the full sample text (computed once in setUpClass)
+        extracted_links = self._extracted_once
         
         # Should extract only terafileshare.com links, not telegram links
-        terafileshare_count = sum(1 for link in extracted_links if 'terafileshare.com' in link)
-        telegram_count = sum(1 for link in extracted_links if 't.me' in link)
+        # Count both link kinds in a single pass
+        terafileshare_count = telegram_count = 0
+        for link in extracted_links:
+            terafileshare_count += 'terafileshare.com' in link
+            telegram_count += 't.me' in link
         
         print(f"   📊 Results:")
         print(f"      TeraFileShare links: {terafileshare_count}")
@@ -222,9 +254,8 @@ class TestTeraFileShareSupport(unittest.TestCase):
         self.assertEqual(telegram_count, 0, "Telegram links should be filtered out")
         
         # Verify specific expected links
-        for expected_link in set(self.expected_links):
-            self.assertIn(expected_link, extracted_links,
-                         f"Expected terafileshare link not found: {expected_link}")
+        missing = self.EXPECTED_SET.difference(extracted_links)
+        self.assertFalse(missing, f"Expected terafileshare links not found: {sorted(missing)}")
         
         print("✅ Comprehensive text processing test passed!")
 
@@ -236,8 +267,8 @@ def run_tests():
     # Create test suite
     suite = unittest.TestLoader().loadTestsFromTestCase(TestTeraFileShareSupport)
     
-    # Run tests with detailed output
-    runner = unittest.TextTestRunner(verbosity=2)
+    # Run tests with detailed output (per-test prints only shown for failures)
+    runner = unittest.TextTestRunner(verbosity=2, buffer=True)
     result = runner.run(suite)
     
     # Print summary
@@ -1,10 +1,159 @@
 """
 Simple validation script to check that st.rerun() calls have been properly handled
 """
+import mmap
 import os
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Tuple
 
+# Files are scanned as raw bytes: every needle is ASCII, so nothing needs
+# decoding except the lines that are actually reported
+RERUN_CALL = b'st.rerun()'
+
+# Problematic rerun patterns, compiled once and reused for every file.
+# [^\n]* spells out that no part of a match may run past a line end, so each
+# pattern stays a two-line match with no DOTALL-style backtracking across lines
+PROBLEMATIC_PATTERNS = [
+    (re.compile(rb'st\.button[^\n]*\n[^\n]*st\.rerun\(\)', re.MULTILINE), 'Button followed by immediate rerun'),
+    (re.compile(rb'st\.success[^\n]*\n[^\n]*st\.rerun\(\)', re.MULTILINE), 'Success message followed by rerun'),
+    (re.compile(rb'st\.error[^\n]*\n[^\n]*st\.rerun\(\)', re.MULTILINE), 'Error message followed by rerun'),
+    (re.compile(rb'st\.session_state\[[^\n]*\][^\n]*=[^\n]*\n[^\n]*st\.rerun\(\)', re.MULTILINE), 'State change followed by rerun')
+]
+
+# All problematic patterns as one alternation: a single scan tells whether a
+# file needs the per-pattern passes at all
+ANY_PROBLEMATIC_PATTERN = re.compile(
+    b'|'.join(b'(?:' + pattern.pattern + b')' for pattern, _ in PROBLEMATIC_PATTERNS), re.MULTILINE
+)
+
+# File scanning is I/O bound (reads release the GIL), so files are read on a thread pool
+SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+
+# Directory names never descended into; .streamlit is only left out of the rerun listing
+SKIP_DIRS = frozenset({'.git', '__pycache__'})
+RERUN_SKIP_DIR = '.streamlit'
+
+def _iter_py_files(directory: str, skip_dirs: frozenset = SKIP_DIRS):
+    """
+    Yield paths of .py files under directory, in os.walk (top-down) order
+    
+    Uses os.scandir so file/directory checks come from the directory entries
+    instead of extra stat calls. Directories named in skip_dirs are pruned
+    together with everything below them. (Path.rglob cannot prune, so it
+    would still list all of .git before the skip filter could drop it.)
+    """
+    subdirs = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if entry.name not in skip_dirs and not entry.is_symlink():
+                        subdirs.append(entry.path)
+                elif entry.name.endswith('.py'):
+                    yield entry.path
+    except OSError:
+        return
+    
+    for subdir in subdirs:
+        yield from _iter_py_files(subdir, skip_dirs)
+
+def _scan_files(scan, file_paths):
+    """Run scan on every path using the thread pool; results keep the input order"""
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+        yield from executor.map(scan, file_paths)
+
+def _rerun_lines(content: bytes) -> List[Tuple[int, str]]:
+    """
+    Return (line_number, stripped_line) for every line containing a rerun call
+    
+    Jumps between occurrences with bytes.find and counts newlines only up to
+    each hit, instead of splitting the whole file into lines.
+    """
+    file_reruns = []
+    line_number = 1
+    counted_up_to = 0
+    position = content.find(RERUN_CALL)
+    while position != -1:
+        line_start = content.rfind(b'\n', 0, position) + 1
+        line_end = content.find(b'\n', position)
+        if line_end == -1:
+            line_end = len(content)
+        
+        line_number += content.count(b'\n', counted_up_to, line_start)
+        counted_up_to = line_start
+        file_reruns.append((line_number, content[line_start:line_end].strip().decode('utf-8')))
+        
+        # One entry per line, like the line-by-line scan
+        position = content.find(RERUN_CALL, line_end)
+    return file_reruns
+
+def _scan_file(file_path: str):
+    """
+    Read one file once and collect everything the validators need from it
+    
+    Returns:
+        (file_path, [(line_number, line_content)], [(description, match_count)], error)
+        where the rerun list is None if the file could not be read or decoded
+    """
+    # Only the read can fail; unreadable files are reported by the caller
+    try:
+        with open(file_path, 'rb') as f:
+            content = f.read()
+    except OSError as e:
+        return file_path, None, [], e
+    
+    # Every rerun check needs a rerun call; skip all line and regex scans when there is none
+    if RERUN_CALL not in content:
+        return file_path, [], [], None
+    
+    error = None
+    try:
+        file_reruns = _rerun_lines(content)
+    except UnicodeDecodeError as e:
+        file_reruns, error = None, e
+    
+    # One combined pass first; per-pattern counts only for files that match
+    found = []
+    if ANY_PROBLEMATIC_PATTERN.search(content):
+        for pattern, description in PROBLEMATIC_PATTERNS:
+            matches = pattern.findall(content)
+            if matches:
+                found.append((description, len(matches)))
+    
+    return file_path, file_reruns, found, error
+
+def scan_all(directory: str) -> Tuple[Dict[str, List[Tuple[int, str]]], List[Tuple[str, str, int]]]:
+    """
+    Walk the tree and read every Python file once for both validators
+    
+    Args:
+        directory: Directory to search
+        
+    Returns:
+        Tuple of (rerun_calls, pattern_issues): rerun_calls as returned by
+        find_rerun_calls, pattern_issues as (file_path, description, match_count)
+    """
+    rerun_calls = {}
+    pattern_issues = []
+    
+    # Skip certain directories (.streamlit only for the rerun listing)
+    # Every yielded path is os.path.join(directory, ...), so the path relative to
+    # directory is a plain slice; no per-file os.path.relpath normalization
+    prefix_length = len(os.path.join(directory, ''))
+    for file_path, file_reruns, found, error in _scan_files(_scan_file, _iter_py_files(directory)):
+        # Path checks only for files that have something to report
+        if (error is not None or file_reruns) and RERUN_SKIP_DIR not in os.path.dirname(file_path).split(os.sep):
+            if error is not None:
+                print(f"Error reading {file_path}: {error}")
+            else:
+                rerun_calls[file_path[prefix_length:]] = file_reruns
+        
+        pattern_issues.extend((file_path, description, match_count) for description, match_count in found)
+    
+    return rerun_calls, pattern_issues
+
 def find_rerun_calls(directory: str) -> Dict[str, List[Tuple[int, str]]]:
     """
     Find all st.rerun() calls in Python files
@@ -15,34 +164,7 @@ def find_rerun_calls(directory: str) -> Dict[str, List[Tuple[int, str]]]:
     Returns:
         Dictionary mapping filenames to list of (line_number, line_content) tuples
     """
-    rerun_calls = {}
-    
-    for root, dirs, files in os.walk(directory):
-        # Skip certain directories
-        if any(skip_dir in root for skip_dir in ['.git', '__pycache__', '.streamlit']):
-            continue
-            
-        for file in files:
-            if file.endswith('.py'):
-                file_path = os.path.join(root, file)
-                relative_path = os.path.relpath(file_path, directory)
-                
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        lines = f.readlines()
-                    
-                    file_reruns = []
-                    for i, line in enumerate(lines, 1):
-                        if 'st.rerun()' in line:
-                            file_reruns.append((i, line.strip()))
-                    
-                    if file_reruns:
-                        rerun_calls[relative_path] = file_reruns
-                        
-                except Exception as e:
-                    print(f"Error reading {file_path}: {e}")
-    
-    return rerun_calls
+    return scan_all(directory)[0]
 
 def analyze_rerun_usage(rerun_calls: Dict[str, List[Tuple[int, str]]]) -> None:
     """
@@ -51,31 +173,37 @@ def analyze_rerun_usage(rerun_calls: Dict[str, List[Tuple[int, str]]]) -> None:
     Args:
         rerun_calls: Dictionary of rerun calls found
     """
-    print("🔍 Analysis of st.rerun() Usage")
-    print("=" * 50)
+    # Collect the whole report and emit it with one write
+    lines = [
+        "🔍 Analysis of st.rerun() Usage",
+        "=" * 50
+    ]
     
     if not rerun_calls:
-        print("✅ No st.rerun() calls found!")
-        print("✅ All button interactions should work without unwanted reloads")
+        lines.append("✅ No st.rerun() calls found!")
+        lines.append("✅ All button interactions should work without unwanted reloads")
+        sys.stdout.write("\n".join(lines) + "\n")
         return
     
     total_calls = sum(len(calls) for calls in rerun_calls.values())
-    print(f"📊 Found {total_calls} st.rerun() calls in {len(rerun_calls)} files")
-    print()
+    lines.append(f"📊 Found {total_calls} st.rerun() calls in {len(rerun_calls)} files")
+    lines.append("")
     
     for file_path, calls in rerun_calls.items():
-        print(f"📄 {file_path}:")
+        lines.append(f"📄 {file_path}:")
         for line_num, line_content in calls:
-            print(f"   Line {line_num}: {line_content}")
+            lines.append(f"   Line {line_num}: {line_content}")
             
             # Analyze context
             if 'button' in line_content.lower():
-                print("   ⚠️  Potential button-related rerun")
+                lines.append("   ⚠️  Potential button-related rerun")
             if 'success' in line_content.lower() or 'error' in line_content.lower():
-                print("   ⚠️  Rerun after status message")
+                lines.append("   ⚠️  Rerun after status message")
             if 'session_state' in line_content:
-                print("   ⚠️  Rerun after state change")
-        print()
+                lines.append("   ⚠️  Rerun after state change")
+        lines.append("")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def check_state_manager_usage() -> bool:
     """
@@ -113,57 +241,44 @@ def check_state_manager_usage() -> bool:
     for file_path in main_files:
         if os.path.exists(file_path):
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    if 'state_manager' in content or 'StateManager' in content:
-                        imported_count += 1
-                        print(f"✅ State Manager imported in {file_path}")
+                # Search the raw bytes through mmap instead of decoding the whole file
+                with open(file_path, 'rb') as f:
+                    if os.fstat(f.fileno()).st_size == 0:
+                        found = False
                     else:
-                        print(f"⚠️  State Manager not imported in {file_path}")
-            except Exception as e:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            found = mm.find(b'state_manager') != -1 or mm.find(b'StateManager') != -1
+                if found:
+                    imported_count += 1
+                    print(f"✅ State Manager imported in {file_path}")
+                else:
+                    print(f"⚠️  State Manager not imported in {file_path}")
+            except OSError as e:
                 print(f"❌ Error checking {file_path}: {e}")
     
     print(f"📊 State Manager imported in {imported_count}/{len(main_files)} main files")
     return imported_count > 0
 
-def validate_button_patterns() -> bool:
+def validate_button_patterns(pattern_issues: List[Tuple[str, str, int]] = None) -> bool:
     """
     Check for common button patterns that might cause issues
     
+    Args:
+        pattern_issues: Issues already collected by scan_all('.'); scanned here if omitted
+        
     Returns:
         True if no problematic patterns found
     """
     print("🔘 Validating Button Patterns")
     print("=" * 50)
     
-    problematic_patterns = [
-        (r'st\.button.*\n.*st\.rerun\(\)', 'Button followed by immediate rerun'),
-        (r'st\.success.*\n.*st\.rerun\(\)', 'Success message followed by rerun'),
-        (r'st\.error.*\n.*st\.rerun\(\)', 'Error message followed by rerun'),
-        (r'st\.session_state\[.*\].*=.*\n.*st\.rerun\(\)', 'State change followed by rerun')
-    ]
+    if pattern_issues is None:
+        pattern_issues = scan_all('.')[1]
     
     issues_found = 0
-    
-    for root, dirs, files in os.walk('.'):
-        if any(skip_dir in root for skip_dir in ['.git', '__pycache__']):
-            continue
-            
-        for file in files:
-            if file.endswith('.py'):
-                file_path = os.path.join(root, file)
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    for pattern, description in problematic_patterns:
-                        matches = re.findall(pattern, content, re.MULTILINE)
-                        if matches:
-                            print(f"⚠️  {file_path}: {description}")
-                            issues_found += len(matches)
-                            
-                except Exception as e:
-                    continue
+    for file_path, description, match_count in pattern_issues:
+        print(f"⚠️  {file_path}: {description}")
+        issues_found += match_count
     
     if issues_found == 0:
         print("✅ No problematic button patterns found")
@@ -178,8 +293,9 @@ def main():
     print("=" * 60)
     print()
     
-    # Find all st.rerun() calls
-    rerun_calls = find_rerun_calls('.')
+    # Find all st.rerun() calls and problematic patterns in a single pass over the tree
+    rerun_calls, pattern_issues = scan_all('.')
+    total_reruns = sum(len(calls) for calls in rerun_calls.values())
     analyze_rerun_usage(rerun_calls)
     
     print()
@@ -190,13 +306,13 @@ def main():
     print()
     
     # Validate button patterns
-    patterns_ok = validate_button_patterns()
+    patterns_ok = validate_button_patterns(pattern_issues)
     
     print()
     print("📋 Summary")
     print("=" * 50)
     
-    if not rerun_calls and state_manager_ok and patterns_ok:
+    if not total_reruns and state_manager_ok and patterns_ok:
         print("🎉 SUCCESS: All validations passed!")
         print("✅ No unwanted st.rerun() calls found")
         print("✅ State management is properly implemented") 
@@ -204,8 +320,8 @@ def main():
         print("✅ Your app should no longer have button reload issues!")
     else:
         print("⚠️  ISSUES DETECTED:")
-        if rerun_calls:
-            print(f"   - {sum(len(calls) for calls in rerun_calls.values())} st.rerun() calls still present")
+        if total_reruns:
+            print(f"   - {total_reruns} st.rerun() calls still present")
         if not state_manager_ok:
             print("   - State Manager not properly integrated")
         if not patterns_ok:
@@ -2,8 +2,38 @@
 Simple verification script for the browser functionality implementation
 """
 
-import os
+import functools
 import platform
+import sys
+
+# Prefer a single Aho-Corasick pass for multi-string checks when installed
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+@functools.lru_cache(maxsize=None)
+def _read_file(file_path):
+    """Read a file once; every later check of the same path reuses its content"""
+    with open(file_path, "r", encoding="utf-8") as f:
+        return f.read()
+
+@functools.lru_cache(maxsize=None)
+def _needle_automaton(needles):
+    """Aho-Corasick automaton for a tuple of required strings (built once per tuple)"""
+    automaton = ahocorasick.Automaton()
+    for needle in needles:
+        automaton.add_word(needle, needle)
+    automaton.make_automaton()
+    return automaton
+
+def _found_strings(content, needles):
+    """Return the set of needles that occur in content"""
+    needles = tuple(needles)
+    if ahocorasick is None:
+        return {needle for needle in needles if needle in content}
+    # One linear pass reports every needle, overlapping ones included
+    return {needle for _, needle in _needle_automaton(needles).iter(content)}
 
 def verify_files_exist():
     """Verify all required files exist"""
@@ -21,7 +51,17 @@ def verify_files_exist():
     missing_files = []
     
     for file_path in required_files:
-        if os.path.exists(file_path):
+        # Reading here (instead of os.path.exists) lets the later checks reuse the content
+        try:
+            _read_file(file_path)
+            exists = True
+        except FileNotFoundError:
+            exists = False
+        except (OSError, UnicodeDecodeError):
+            # Present but unreadable; the content checks report the error
+            exists = True
+        
+        if exists:
             print(f"✅ {file_path}")
         else:
             print(f"❌ {file_path}")
@@ -35,8 +75,7 @@ def verify_browser_utils():
     
     try:
         # Check if the file has the expected functions
-        with open("utils/browser_utils.py", "r", encoding="utf-8") as f:
-            content = f.read()
+        content = _read_file("utils/browser_utils.py")
         
         required_functions = [
             "class BrowserManager",
@@ -45,8 +84,9 @@ def verify_browser_utils():
             "def display_browser_open_result"
         ]
         
+        found = _found_strings(content, required_functions)
         for func in required_functions:
-            if func in content:
+            if func in found:
                 print(f"✅ {func}")
             else:
                 print(f"❌ {func}")
@@ -91,11 +131,11 @@ def verify_page_modifications():
     for file_path, required_strings in pages_to_check.items():
         print(f"\nChecking {file_path}:")
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            content = _read_file(file_path)
             
+            found = _found_strings(content, required_strings)
             for req_string in required_strings:
-                if req_string in content:
+                if req_string in found:
                     print(f"  ✅ {req_string}")
                 else:
                     print(f"  ❌ {req_string}")
@@ -105,51 +145,61 @@ def verify_page_modifications():
     
     return True
 
+@functools.lru_cache(maxsize=None)
+def _system_info():
+    """(system, release, machine, python_version), queried from the platform module once"""
+    return platform.system(), platform.release(), platform.machine(), platform.python_version()
+
 def show_system_info():
     """Show system information for browser compatibility"""
+    system, release, machine, python_version = _system_info()
     print("\n💻 System Information:")
-    print(f"OS: {platform.system()} {platform.release()}")
-    print(f"Architecture: {platform.machine()}")
-    print(f"Python: {platform.python_version()}")
+    print(f"OS: {system} {release}")
+    print(f"Architecture: {machine}")
+    print(f"Python: {python_version}")
 
 def show_implementation_summary():
     """Show what was implemented"""
-    print("\n📋 IMPLEMENTATION SUMMARY")
-    print("=" * 50)
-    
-    print("\n🎯 What was implemented:")
-    print("• Centralized browser management utility (utils/browser_utils.py)")
-    print("• Cross-platform browser detection (Windows, macOS, Linux)")
-    print("• 'Open Direct File Link' buttons in all modes:")
-    print("  - 💳 RapidAPI Mode: Single & bulk file processing")
-    print("  - 🍪 Cookie Mode: Single & bulk file processing") 
-    print("  - 📁 File Manager: Official API file operations")
-    print("  - Main App: File cards with open link functionality")
-    print("• Browser settings tab in Settings page")
-    print("• Browser preference persistence per session")
-    print("• Error handling and user feedback")
-    print("• Test functionality for browser opening")
-    
-    print("\n🌐 Supported browsers:")
-    print("• Default system browser")
-    print("• Google Chrome")
-    print("• Mozilla Firefox") 
-    print("• Microsoft Edge")
-    print("• Safari (macOS only)")
-    
-    print("\n🔗 Link types supported:")
-    print("• direct_link (RapidAPI responses)")
-    print("• download_link (Cookie mode responses)")
-    print("• dlink (Official API responses)")
-    print("• link (Alternative/backup links)")
-    
-    print("\n✨ Features:")
-    print("• Automatic browser detection")
-    print("• Fallback to default browser if preferred fails")
-    print("• Session-based browser preferences")
-    print("• Success celebrations (balloons)")
-    print("• Detailed error messages")
-    print("• Test functionality in settings")
+    # Collect every line first and emit the whole summary with one write
+    lines = [
+        "\n📋 IMPLEMENTATION SUMMARY",
+        "=" * 50,
+        
+        "\n🎯 What was implemented:",
+        "• Centralized browser management utility (utils/browser_utils.py)",
+        "• Cross-platform browser detection (Windows, macOS, Linux)",
+        "• 'Open Direct File Link' buttons in all modes:",
+        "  - 💳 RapidAPI Mode: Single & bulk file processing",
+        "  - 🍪 Cookie Mode: Single & bulk file processing",
+        "  - 📁 File Manager: Official API file operations",
+        "  - Main App: File cards with open link functionality",
+        "• Browser settings tab in Settings page",
+        "• Browser preference persistence per session",
+        "• Error handling and user feedback",
+        "• Test functionality for browser opening",
+        
+        "\n🌐 Supported browsers:",
+        "• Default system browser",
+        "• Google Chrome",
+        "• Mozilla Firefox",
+        "• Microsoft Edge",
+        "• Safari (macOS only)",
+        
+        "\n🔗 Link types supported:",
+        "• direct_link (RapidAPI responses)",
+        "• download_link (Cookie mode responses)",
+        "• dlink (Official API responses)",
+        "• link (Alternative/backup links)",
+        
+        "\n✨ Features:",
+        "• Automatic browser detection",
+        "• Fallback to default browser if preferred fails",
+        "• Session-based browser preferences",
+        "• Success celebrations (balloons)",
+        "• Detailed error messages",
+        "• Test functionality in settings"
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def main():
     """Main verification function"""
@@ -10,22 +10,29 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from utils.rapidapi_key_manager import RapidAPIKeyManager, KeyStatus
 from utils.terabox_config import get_config_manager
+import functools
 import time
 
+# Test keys (dummy keys for testing)
+TEST_KEYS = (
+    "test1234567890msh1234567890123456p123456jsn1234567890",
+    "test2345678901msh2345678901234567p234567jsn2345678901",
+    "test3456789012msh3456789012345678p345678jsn3456789012"
+)
+
+@functools.lru_cache(maxsize=1)
+def _shared_key_manager() -> RapidAPIKeyManager:
+    """Key manager over TEST_KEYS, built once and reused by every run of the tests"""
+    return RapidAPIKeyManager(list(TEST_KEYS))
+
 def test_key_manager():
     """Test the RapidAPI key manager functionality"""
     print("🧪 Testing RapidAPI Key Manager...")
     
-    # Test keys (dummy keys for testing)
-    test_keys = [
-        "test1234567890msh1234567890123456p123456jsn1234567890",
-        "test2345678901msh2345678901234567p234567jsn2345678901",
-        "test3456789012msh3456789012345678p345678jsn3456789012"
-    ]
-    
-    # Initialize key manager
-    key_manager = RapidAPIKeyManager(test_keys)
-    print(f"✅ Key manager initialized with {len(test_keys)} keys")
+    # Reuse the shared key manager; reset key health so each run starts clean
+    key_manager = _shared_key_manager()
+    key_manager.reset_all_keys()
+    print(f"✅ Key manager initialized with {len(TEST_KEYS)} keys")
     
     # Test getting next key
     key_info = key_manager.get_next_key()
@@ -36,15 +36,132 @@ Security Considerations:
 - Error handling to prevent system exploitation
 """
 
+import copy
+import functools
 import webbrowser
 import platform
 import subprocess
+import threading
 import os
 import streamlit as st
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterable, Set
 import logging
 from utils.config import log_info, log_error
 
+def _existing_paths(paths: Iterable[str]) -> Set[str]:
+    """Return the subset of paths that exist on disk"""
+    return {path for path in paths if os.path.exists(path)}
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_browsers_once(system: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Detect installed browsers for a platform (cached)
+    
+    Installed-browser state is effectively static within a process, so the
+    path probes run once per platform.system() value instead of on every
+    BrowserManager instantiation.
+    """
+    browsers = {
+        'default': {
+            'name': 'Default Browser',
+            'description': 'System default browser',
+            'command': None,
+            'icon': '🌐'
+        },
+        'chrome': {
+            'name': 'Google Chrome',
+            'description': 'Google Chrome browser',
+            'icon': '🟢',
+            'paths': {
+                'windows': [
+                    r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+                    r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+                    os.path.expanduser(r"~\AppData\Local\Google\Chrome\Application\chrome.exe")
+                ],
+                'linux': [
+                    '/usr/bin/google-chrome',
+                    '/usr/bin/google-chrome-stable',
+                    '/usr/bin/chromium-browser',
+                    '/snap/bin/chromium'
+                ],
+                'darwin': [
+                    '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'
+                ]
+            }
+        },
+        'firefox': {
+            'name': 'Mozilla Firefox',
+            'description': 'Mozilla Firefox browser',
+            'icon': '🦊',
+            'paths': {
+                'windows': [
+                    r"C:\Program Files\Mozilla Firefox\firefox.exe",
+                    r"C:\Program Files (x86)\Mozilla Firefox\firefox.exe",
+                    os.path.expanduser(r"~\AppData\Local\Mozilla Firefox\firefox.exe")
+                ],
+                'linux': [
+                    '/usr/bin/firefox',
+                    '/usr/bin/firefox-esr',
+                    '/snap/bin/firefox'
+                ],
+                'darwin': [
+                    '/Applications/Firefox.app/Contents/MacOS/firefox'
+                ]
+            }
+        },
+        'edge': {
+            'name': 'Microsoft Edge',
+            'description': 'Microsoft Edge browser',
+            'icon': '🔷',
+            'paths': {
+                'windows': [
+                    r"C:\Program Files (x86)\Microsoft\Edge\Application\msedge.exe",
+                    r"C:\Program Files\Microsoft\Edge\Application\msedge.exe"
+                ],
+                'linux': [
+                    '/usr/bin/microsoft-edge',
+                    '/usr/bin/microsoft-edge-stable'
+                ],
+                'darwin': [
+                    '/Applications/Microsoft Edge.app/Contents/MacOS/Microsoft Edge'
+                ]
+            }
+        },
+        'safari': {
+            'name': 'Safari',
+            'description': 'Apple Safari browser (macOS only)',
+            'icon': '🧭',
+            'paths': {
+                'darwin': [
+                    '/Applications/Safari.app/Contents/MacOS/Safari'
+                ]
+            }
+        }
+    }
+    
+    # Check which browsers are actually available
+    existing = _existing_paths(
+        path
+        for browser_info in browsers.values()
+        for path in browser_info.get('paths', {}).get(system, ())
+    )
+    available_browsers = {'default': browsers['default']}
+    
+    for browser_id, browser_info in browsers.items():
+        if browser_id == 'default':
+            continue
+            
+        if system in browser_info.get('paths', {}):
+            for path in browser_info['paths'][system]:
+                if path in existing:
+                    browser_info['command'] = path
+                    available_browsers[browser_id] = browser_info
+                    break
+    
+    return available_browsers
+
+
 class BrowserManager:
     """
     Manages browser opening functionality with multiple browser support
@@ -103,101 +220,9 @@ class BrowserManager:
     
     def _get_supported_browsers(self) -> Dict[str, Dict[str, Any]]:
         """Get list of supported browsers with their configurations"""
-        system = platform.system().lower()
-        
-        browsers = {
-            'default': {
-                'name': 'Default Browser',
-                'description': 'System default browser',
-                'command': None,
-                'icon': '🌐'
-            },
-            'chrome': {
-                'name': 'Google Chrome',
-                'description': 'Google Chrome browser',
-                'icon': '🟢',
-                'paths': {
-                    'windows': [
-                        r"C:\Program Files\Google\Chrome\Application\chrome.exe",
-                        r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
-                        os.path.expanduser(r"~\AppData\Local\Google\Chrome\Application\chrome.exe")
-                    ],
-                    'linux': [
-                        '/usr/bin/google-chrome',
-                        '/usr/bin/google-chrome-stable',
-                        '/usr/bin/chromium-browser',
-                        '/snap/bin/chromium'
-                    ],
-                    'darwin': [
-                        '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'
-                    ]
-                }
-            },
-            'firefox': {
-                'name': 'Mozilla Firefox',
-                'description': 'Mozilla Firefox browser',
-                'icon': '🦊',
-                'paths': {
-                    'windows': [
-                        r"C:\Program Files\Mozilla Firefox\firefox.exe",
-                        r"C:\Program Files (x86)\Mozilla Firefox\firefox.exe",
-                        os.path.expanduser(r"~\AppData\Local\Mozilla Firefox\firefox.exe")
-                    ],
-                    'linux': [
-                        '/usr/bin/firefox',
-                        '/usr/bin/firefox-esr',
-                        '/snap/bin/firefox'
-                    ],
-                    'darwin': [
-                        '/Applications/Firefox.app/Contents/MacOS/firefox'
-                    ]
-                }
-            },
-            'edge': {
-                'name': 'Microsoft Edge',
-                'description': 'Microsoft Edge browser',
-                'icon': '🔷',
-                'paths': {
-                    'windows': [
-                        r"C:\Program Files (x86)\Microsoft\Edge\Application\msedge.exe",
-                        r"C:\Program Files\Microsoft\Edge\Application\msedge.exe"
-                    ],
-                    'linux': [
-                        '/usr/bin/microsoft-edge',
-                        '/usr/bin/microsoft-edge-stable'
-                    ],
-                    'darwin': [
-                        '/Applications/Microsoft Edge.app/Contents/MacOS/Microsoft Edge'
-                    ]
-                }
-            },
-            'safari': {
-                'name': 'Safari',
-                'description': 'Apple Safari browser (macOS only)',
-                'icon': '🧭',
-                'paths': {
-                    'darwin': [
-                        '/Applications/Safari.app/Contents/MacOS/Safari'
-                    ]
-                }
-            }
-        }
-        
-        # Check which browsers are actually available
-        available_browsers = {'default': browsers['default']}
-        
-        for browser_id, browser_info in browsers.items():
-            if browser_id == 'default':
-                continue
-                
-            if system in browser_info.get('paths', {}):
-                for path in browser_info['paths'][system]:
-                    if os.path.exists(path):
-                        browser_info['command'] = path
-                        available_browsers[browser_id] = browser_info
-                        break
-        
-        return available_browsers
+        # Detection is cached per process; hand out a copy so callers can't
+        # mutate the shared result
+        return copy.deepcopy(_detect_browsers_once(platform.system().lower()))
     
     def _get_default_browser(self) -> str:
         """Get the default browser preference"""
@@ -366,12 +391,16 @@ class BrowserManager:
 
 # Global browser manager instance
 _browser_manager = None
+_browser_manager_lock = threading.Lock()
 
 def get_browser_manager() -> BrowserManager:
-    """Get global browser manager instance"""
+    """Get global browser manager instance (thread-safe)"""
     global _browser_manager
+    # Double-checked locking: the lock is only taken until the instance exists
     if _browser_manager is None:
-        _browser_manager = BrowserManager()
+        with _browser_manager_lock:
+            if _browser_manager is None:
+                _browser_manager = BrowserManager()
     return _browser_manager
 
 def open_url_in_browser(url: str, browser: Optional[str] = None, new_tab: bool = True) -> Dict[str, Any]:
@@ -542,3 +571,15 @@ def display_browser_open_result(result: Dict[str, Any], show_details: bool = Tru
                             st.success(f"✅ {attempt['browser']}: {attempt['message']}")
                         else:
                             st.error(f"❌ {attempt['browser']}: {attempt['message']}")
+
+# Optional pre-warm: run browser detection in the background so it overlaps
+# with Streamlit's own startup (opt-in to keep test runs deterministic). Only
+# the cached detection is warmed; the manager itself is still built on first
+# use, where the session's browser preference is available.
+if os.getenv('TERABOX_PREWARM_BROWSER') == '1':
+    threading.Thread(
+        target=_detect_browsers_once,
+        args=(platform.system().lower(),),
+        name='browser-prewarm',
+        daemon=True
+    ).start()
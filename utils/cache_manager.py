@@ -37,11 +37,14 @@ import os
 import time
 import hashlib
 import re
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable
 from datetime import datetime, timedelta
 from utils.config import log_error, log_info
 from utils.terabox_config import get_config_manager
 
+# surl identifier in either query (?surl=...) or path (/s/...) form
+SURL_RE = re.compile(r'(?:surl=|/s/)([a-zA-Z0-9_-]+)')
+
 class TeraBoxCacheManager:
     """
     Manages intelligent caching of TeraBox RapidAPI responses
@@ -64,13 +67,15 @@ class TeraBoxCacheManager:
     - Offline Access: Cached data available without internet
     """
     
-    def __init__(self, cache_dir: str = None, cache_ttl_hours: int = None):
+    def __init__(self, cache_dir: str = None, cache_ttl_hours: int = None,
+                 time_fn: Callable[[], float] = time.time):
         """
         Initialize cache manager with configuration and directory setup
         
         Args:
             cache_dir: Directory to store cache files (uses config default if None)
             cache_ttl_hours: Cache time-to-live in hours (uses config default if None)
+            time_fn: Clock returning epoch seconds (injectable for tests)
             
         Initialization Process:
         1. Load configuration from centralized config manager
@@ -100,6 +105,9 @@ class TeraBoxCacheManager:
         self.cache_ttl_hours = cache_ttl_hours if cache_ttl_hours is not None else cache_config.default_ttl_hours
         self.cache_ttl_seconds = self.cache_ttl_hours * 3600  # Convert to seconds for calculations
         
+        # Clock used for timestamps and TTL checks
+        self._now = time_fn
+        
         # Cache Management Settings
         self.enable_cache = cache_config.enable_global_cache
         self.max_cache_size_mb = cache_config.max_cache_size_mb
@@ -126,18 +134,12 @@ class TeraBoxCacheManager:
         This will be used as the unique cache key
         """
         try:
-            # Handle different TeraBox URL formats
-            patterns = [
-                r'surl=([a-zA-Z0-9_-]+)',  # Query parameter format
-                r'/s/([a-zA-Z0-9_-]+)',    # Path format
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, terabox_url)
-                if match:
-                    surl = match.group(1)
-                    log_info(f"Extracted surl: {surl} from URL: {terabox_url}")
-                    return surl
+            # Handle both TeraBox URL formats (query parameter and path)
+            match = SURL_RE.search(terabox_url)
+            if match:
+                surl = match.group(1)
+                log_info(f"Extracted surl: {surl} from URL: {terabox_url}")
+                return surl
             
             # If no pattern matches, create hash of the URL as fallback
             url_hash = hashlib.md5(terabox_url.encode()).hexdigest()[:12]
@@ -159,7 +161,7 @@ class TeraBoxCacheManager:
         """Check if cached data is still valid based on TTL"""
         try:
             cache_timestamp = cache_data.get('cache_metadata', {}).get('timestamp', 0)
-            current_time = time.time()
+            current_time = self._now()
             
             # Check if cache is within TTL
             age_seconds = current_time - cache_timestamp
@@ -221,7 +223,7 @@ class TeraBoxCacheManager:
                 cached_response['_cache_info'] = {
                     'cached': True,
                     'cache_timestamp': cache_data.get('cache_metadata', {}).get('timestamp'),
-                    'cache_age_hours': (time.time() - cache_data.get('cache_metadata', {}).get('timestamp', 0)) / 3600,
+                    'cache_age_hours': (self._now() - cache_data.get('cache_metadata', {}).get('timestamp', 0)) / 3600,
                     'surl': surl
                 }
                 
@@ -233,6 +235,20 @@ class TeraBoxCacheManager:
             log_error(e, "get_cached_response")
             return None
     
+    def _build_cache_entry(self, terabox_url: str, surl: str, response_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the on-disk cache entry (metadata + response) shared by every cache writer"""
+        return {
+            'cache_metadata': {
+                'timestamp': self._now(),
+                'created_at': datetime.now().isoformat(),
+                'terabox_url': terabox_url,
+                'surl': surl,
+                'ttl_hours': self.cache_ttl_hours,
+                'cache_version': '1.0'
+            },
+            'response_data': response_data
+        }
+    
     def save_response_to_cache(self, terabox_url: str, response_data: Dict[str, Any]) -> bool:
         """
         Save API response to cache
@@ -255,17 +271,7 @@ class TeraBoxCacheManager:
             cache_file = self._get_cache_file_path(surl)
             
             # Prepare cache data
-            cache_data = {
-                'cache_metadata': {
-                    'timestamp': time.time(),
-                    'created_at': datetime.now().isoformat(),
-                    'terabox_url': terabox_url,
-                    'surl': surl,
-                    'ttl_hours': self.cache_ttl_hours,
-                    'cache_version': '1.0'
-                },
-                'response_data': response_data
-            }
+            cache_data = self._build_cache_entry(terabox_url, surl, response_data)
             
             # Save to file
             with open(cache_file, 'w', encoding='utf-8') as f:
@@ -278,6 +284,25 @@ class TeraBoxCacheManager:
             log_error(e, "save_response_to_cache")
             return False
     
+    def save_many(self, responses: Dict[str, Dict[str, Any]]) -> int:
+        """
+        Save several API responses to cache
+        
+        Args:
+            responses: Mapping of TeraBox URL to the API response data to cache
+            
+        Returns:
+            Number of entries saved successfully
+        """
+        # One writer: every entry goes through save_response_to_cache
+        saved_count = sum(
+            self.save_response_to_cache(terabox_url, response_data)
+            for terabox_url, response_data in responses.items()
+        )
+        
+        log_info(f"Batch cached {saved_count}/{len(responses)} responses")
+        return saved_count
+    
     def clear_cache(self, surl: str = None) -> Dict[str, Any]:
         """
         Clear cache files
@@ -361,7 +386,7 @@ class TeraBoxCacheManager:
                                 'filename': filename,
                                 'surl': cache_metadata.get('surl', 'unknown'),
                                 'created_at': cache_metadata.get('created_at', 'unknown'),
-                                'age_hours': (time.time() - cache_metadata.get('timestamp', 0)) / 3600,
+                                'age_hours': (self._now() - cache_metadata.get('timestamp', 0)) / 3600,
                                 'size_kb': file_size / 1024,
                                 'is_valid': is_valid,
                                 'terabox_url': cache_metadata.get('terabox_url', 'unknown')
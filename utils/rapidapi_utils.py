@@ -186,6 +186,41 @@ def _calculate_text_complexity(text: str) -> float:
     return round(complexity, 3)
 
 
+# TeraFile Share short links (also used by tests to look up the pattern description)
+TERAFILESHARE_PATTERN = r'https://terafileshare\.com/s/[A-Za-z0-9_-]+(?:\?[^\\s]*)?'
+
+# Comprehensive TeraBox URL patterns (compiled once below, see _COMPILED_URL_PATTERNS)
+TERABOX_URL_PATTERNS = (
+    # Official TeraBox Domains - Enhanced patterns
+    r'https://www\.terabox\.app/sharing/link\?surl=[A-Za-z0-9_-]+(?:&[^\\s]*)?',  # With optional parameters
+    r'https://terabox\.com/s/[A-Za-z0-9_-]+(?:\?[^\\s]*)?',  # With optional query params
+    r'https://www\.terabox\.com/sharing/link\?surl=[A-Za-z0-9_-]+(?:&[^\\s]*)?',
+    r'https://terabox\.app/s/[A-Za-z0-9_-]+(?:\?[^\\s]*)?',
+    r'https://www\.terabox\.app/s/[A-Za-z0-9_-]+(?:\?[^\\s]*)?',
+    
+    # Mirror and Alternative Domains - Enhanced patterns
+    r'https://1024terabox\.com/s/[A-Za-z0-9_-]+(?:\?[^\\s]*)?',
+    r'https://1024tera\.com/s/[A-Za-z0-9_-]+(?:\?[^\\s]*)?',
+    r'https://www\.1024tera\.com/s/[A-Za-z0-9_-]+(?:\?[^\\s]*)?',
+    r'https://teraboxapp\.com/s/[A-Za-z0-9_-]+(?:\?[^\\s]*)?',
+    r'https://freeterabox\.com/s/[A-Za-z0-9_-]+(?:\?[^\\s]*)?',
+    r'https://nephobox\.com/s/[A-Za-z0-9_-]+(?:\?[^\\s]*)?',
+    
+    # Share Link Domains - Enhanced patterns
+    r'https://terasharelink\.com/s/[A-Za-z0-9_-]+(?:\?[^\\s]*)?',
+    TERAFILESHARE_PATTERN,
+    r'https://www\.terafileshare\.com/s/[A-Za-z0-9_-]+(?:\?[^\\s]*)?',
+    
+    # Generic patterns for new domains - More flexible
+    r'https://[a-zA-Z0-9.-]*terabox[a-zA-Z0-9.-]*/s/[A-Za-z0-9_-]+(?:\?[^\\s]*)?',
+    r'https://[a-zA-Z0-9.-]*terabox[a-zA-Z0-9.-]*/sharing/link\?surl=[A-Za-z0-9_-]+(?:&[^\\s]*)?',
+    
+    # Protocol-agnostic patterns for edge cases
+    r'(?:https?://)?(?:www\.)?terabox\.(?:com|app)/s/[A-Za-z0-9_-]+',
+    r'(?:https?://)?(?:www\.)?terabox\.(?:com|app)/sharing/link\?surl=[A-Za-z0-9_-]+'
+)
+
+
 def _get_comprehensive_url_patterns() -> List[str]:
     """
     Get comprehensive list of TeraBox URL patterns
@@ -195,35 +230,7 @@ def _get_comprehensive_url_patterns() -> List[str]:
     """
     log_info("Building comprehensive TeraBox URL pattern list")
     
-    patterns = [
-        # Official TeraBox Domains - Enhanced patterns
-        r'https://www\.terabox\.app/sharing/link\?surl=[A-Za-z0-9_-]+(?:&[^\\s]*)?',  # With optional parameters
-        r'https://terabox\.com/s/[A-Za-z0-9_-]+(?:\?[^\\s]*)?',  # With optional query params
-        r'https://www\.terabox\.com/sharing/link\?surl=[A-Za-z0-9_-]+(?:&[^\\s]*)?',
-        r'https://terabox\.app/s/[A-Za-z0-9_-]+(?:\?[^\\s]*)?',
-        r'https://www\.terabox\.app/s/[A-Za-z0-9_-]+(?:\?[^\\s]*)?',
-        
-        # Mirror and Alternative Domains - Enhanced patterns
-        r'https://1024terabox\.com/s/[A-Za-z0-9_-]+(?:\?[^\\s]*)?',
-        r'https://1024tera\.com/s/[A-Za-z0-9_-]+(?:\?[^\\s]*)?',
-        r'https://www\.1024tera\.com/s/[A-Za-z0-9_-]+(?:\?[^\\s]*)?',
-        r'https://teraboxapp\.com/s/[A-Za-z0-9_-]+(?:\?[^\\s]*)?',
-        r'https://freeterabox\.com/s/[A-Za-z0-9_-]+(?:\?[^\\s]*)?',
-        r'https://nephobox\.com/s/[A-Za-z0-9_-]+(?:\?[^\\s]*)?',
-        
-        # Share Link Domains - Enhanced patterns
-        r'https://terasharelink\.com/s/[A-Za-z0-9_-]+(?:\?[^\\s]*)?',
-        r'https://terafileshare\.com/s/[A-Za-z0-9_-]+(?:\?[^\\s]*)?',
-        r'https://www\.terafileshare\.com/s/[A-Za-z0-9_-]+(?:\?[^\\s]*)?',
-        
-        # Generic patterns for new domains - More flexible
-        r'https://[a-zA-Z0-9.-]*terabox[a-zA-Z0-9.-]*/s/[A-Za-z0-9_-]+(?:\?[^\\s]*)?',
-        r'https://[a-zA-Z0-9.-]*terabox[a-zA-Z0-9.-]*/sharing/link\?surl=[A-Za-z0-9_-]+(?:&[^\\s]*)?',
-        
-        # Protocol-agnostic patterns for edge cases
-        r'(?:https?://)?(?:www\.)?terabox\.(?:com|app)/s/[A-Za-z0-9_-]+',
-        r'(?:https?://)?(?:www\.)?terabox\.(?:com|app)/sharing/link\?surl=[A-Za-z0-9_-]+'
-    ]
+    patterns = list(TERABOX_URL_PATTERNS)
     
     log_info(f"Comprehensive pattern list built - {len(patterns)} patterns available")
     return patterns
@@ -282,7 +289,11 @@ def _execute_pattern_matching(patterns: List[str], text: str) -> tuple:
         
         pattern_start = time.time()
         try:
-            links = re.findall(pattern, text, re.IGNORECASE)
+            compiled = _COMPILED_URL_PATTERNS.get(pattern)
+            if compiled is not None:
+                links = compiled.findall(text)
+            else:
+                links = re.findall(pattern, text, re.IGNORECASE)
             pattern_duration = time.time() - pattern_start
             
             all_links.extend(links)
@@ -311,6 +322,43 @@ def _execute_pattern_matching(patterns: List[str], text: str) -> tuple:
     return all_links, pattern_stats
 
 
+# Human-readable pattern names, keyed by a substring of the pattern
+_PATTERN_DESCRIPTIONS = {
+    'terasharelink': 'TeraShare Links',
+    'terafileshare': 'TeraFile Share Links',
+    'terabox\\.app.*sharing': 'Official App Sharing',
+    'terabox\\.com.*sharing': 'Official Sharing Links',
+    'terabox\\.com/s': 'Standard Short Links',
+    'terabox\\.app/s': 'App Short Links',
+    '1024terabox': '1024 TeraBox Mirror',
+    '1024tera': '1024 Tera Mirror',
+    'teraboxapp': 'TeraBox App Domain',
+    'freeterabox': 'Free TeraBox Mirror',
+    'nephobox': 'Nepho Box Mirror',
+    'terabox.*s/': 'Generic TeraBox Pattern',
+    'terabox.*sharing': 'Generic Sharing Pattern'
+}
+
+
+def _match_pattern_description(pattern: str) -> Optional[str]:
+    """Return the description whose key occurs in the pattern, or None"""
+    pattern_lower = pattern.lower()
+    for key, description in _PATTERN_DESCRIPTIONS.items():
+        if key in pattern_lower:
+            return description
+    return None
+
+
+# Descriptions of the built-in patterns, resolved once so lookups are a dict hit
+_DESCRIPTION_BY_PATTERN = {
+    pattern: description
+    for pattern, description in (
+        (pattern, _match_pattern_description(pattern)) for pattern in TERABOX_URL_PATTERNS
+    )
+    if description is not None
+}
+
+
 def _get_pattern_description(pattern: str, index: int) -> str:
     """
     Get human-readable description for regex pattern
@@ -322,29 +370,17 @@ def _get_pattern_description(pattern: str, index: int) -> str:
     Returns:
         Human-readable pattern description
     """
-    pattern_descriptions = {
-        'terasharelink': 'TeraShare Links',
-        'terafileshare': 'TeraFile Share Links',
-        'terabox\\.app.*sharing': 'Official App Sharing',
-        'terabox\\.com.*sharing': 'Official Sharing Links',
-        'terabox\\.com/s': 'Standard Short Links',
-        'terabox\\.app/s': 'App Short Links',
-        '1024terabox': '1024 TeraBox Mirror',
-        '1024tera': '1024 Tera Mirror',
-        'teraboxapp': 'TeraBox App Domain',
-        'freeterabox': 'Free TeraBox Mirror',
-        'nephobox': 'Nepho Box Mirror',
-        'terabox.*s/': 'Generic TeraBox Pattern',
-        'terabox.*sharing': 'Generic Sharing Pattern'
-    }
-    
-    # Find matching description
-    for key, description in pattern_descriptions.items():
-        if key in pattern.lower():
-            return description
+    # Built-in patterns are precomputed; anything else is matched by substring
+    description = _DESCRIPTION_BY_PATTERN.get(pattern) or _match_pattern_description(pattern)
     
     # Fallback to generic description
-    return f"Pattern {index + 1}"
+    return description or f"Pattern {index + 1}"
+
+
+# Compiled form of every known pattern, so extraction never re-parses pattern strings
+_COMPILED_URL_PATTERNS = {
+    pattern: re.compile(pattern, re.IGNORECASE) for pattern in TERABOX_URL_PATTERNS
+}
 
 
 def _validate_and_filter_links(all_links: List[str]) -> tuple:
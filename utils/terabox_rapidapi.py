@@ -36,12 +36,114 @@ Response Caching Strategy:
 import requests
 import time
 import re
-from typing import Dict, List, Any, Optional
+import functools
+import types
+from typing import Dict, List, Any, Mapping, Optional, Tuple
 from utils.config import log_error, log_info, get_default_download_path
 from utils.cache_manager import TeraBoxCacheManager
 from utils.terabox_config import get_config_manager
 from utils.rapidapi_key_manager import RapidAPIKeyManager
 
+# RapidAPI key format rules, built once at import. Translating a key with
+# _API_KEY_STRIP_ALLOWED deletes every allowed character, leaving only invalid ones.
+_API_KEY_LENGTH = 50
+_API_KEY_STRIP_ALLOWED = str.maketrans('', '', 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789')
+
+# File extension -> file type, used by TeraBoxRapidAPI._get_file_type
+_EXTENSION_TYPES = {
+    **dict.fromkeys(('mp4', 'avi', 'mkv', 'mov', 'wmv', 'flv', 'm4v'), 'video'),
+    **dict.fromkeys(('jpg', 'jpeg', 'png', 'gif', 'bmp', 'webp'), 'image'),
+    **dict.fromkeys(('mp3', 'wav', 'flac', 'aac', 'ogg', 'm4a'), 'audio'),
+    **dict.fromkeys(('pdf', 'doc', 'docx', 'txt', 'rtf'), 'document'),
+    **dict.fromkeys(('zip', 'rar', '7z', 'tar', 'gz'), 'archive'),
+}
+
+
+# Short URL (surl) extractors used by TeraBoxRapidAPI._normalize_terabox_url,
+# in order of specificity
+_SHORT_URL_PATTERNS = (
+    re.compile(r'/s/([^/?&]+)'),  # Standard /s/ format: /s/abc123
+    re.compile(r'surl=([^&]+)'),  # Query parameter format: ?surl=abc123
+)
+
+# Static part of the per-request RapidAPI headers
+_REQUEST_BASE_HEADERS = types.MappingProxyType({
+    'X-RapidAPI-Host': 'terabox-downloader-direct-download-link-generator2.p.rapidapi.com',
+    'User-Agent': 'TeraDL-RapidAPI-Client/1.0',
+    'Accept': 'application/json'
+})
+
+
+@functools.lru_cache(maxsize=64)
+def _request_headers(api_key: str) -> Mapping[str, str]:
+    """Read-only request headers for an API key, built once per key and reused across requests"""
+    return types.MappingProxyType({'X-RapidAPI-Key': api_key, **_REQUEST_BASE_HEADERS})
+
+
+@functools.lru_cache(maxsize=1024)
+def _check_api_key_format(api_key: str) -> Tuple[str, str, Optional[str]]:
+    """
+    Format checks behind TeraBoxRapidAPI._validate_api_key_format, memoized per raw key
+    
+    Returns an immutable (status, message, details) tuple so cached results can
+    never be mutated by a caller; details is None on success.
+    """
+    # Remove any whitespace
+    api_key = api_key.strip()
+    
+    # Length validation
+    expected_length = _API_KEY_LENGTH
+    if len(api_key) != expected_length:
+        return (
+            'failed',
+            f'Invalid API key length. Expected {expected_length} characters, got {len(api_key)}',
+            f'RapidAPI keys are typically {expected_length} characters long'
+        )
+    
+    # Character validation - should only contain allowed characters.
+    # This single translate pass also rejects interior whitespace, so no
+    # separate whitespace scan is needed after the strip above.
+    invalid_chars = api_key.translate(_API_KEY_STRIP_ALLOWED)
+    
+    if invalid_chars:
+        return (
+            'failed',
+            f'API key contains invalid characters: {", ".join(sorted(set(invalid_chars)))}',
+            'RapidAPI keys should only contain letters and numbers'
+        )
+    
+    # Required marker validation
+    api_key_lower = api_key.lower()
+    if 'msh' not in api_key_lower:
+        return (
+            'failed',
+            'API key missing "msh" marker',
+            'Valid RapidAPI keys contain "msh" as a marker'
+        )
+    
+    if 'jsn' not in api_key_lower:
+        return (
+            'failed',
+            'API key missing "jsn" marker',
+            'Valid RapidAPI keys contain "jsn" as a marker'
+        )
+    
+    # Pattern validation - [alphanumeric]msh[alphanumeric]jsn[alphanumeric].
+    # Every character is already known to be alphanumeric, so it is enough that the
+    # earliest 'msh' after the first character is followed, with at least one
+    # character between them, by a 'jsn' that is not at the very end.
+    msh_index = api_key_lower.find('msh', 1)
+    jsn_index = api_key_lower.rfind('jsn', 0, len(api_key_lower) - 1)
+    if msh_index == -1 or jsn_index < msh_index + 4:
+        return (
+            'failed',
+            'Invalid API key format. RapidAPI keys should contain "msh" and "jsn" markers',
+            'Expected format: [alphanumeric]msh[alphanumeric]jsn[alphanumeric]'
+        )
+    
+    return ('success', 'API key format is valid', None)
+
+
 class TeraBoxRapidAPI:
     """
     RapidAPI-based TeraBox client for commercial service integration
@@ -70,7 +172,8 @@ class TeraBoxRapidAPI:
     - Performance benefits: faster responses, reduced API costs
     """
     
-    def __init__(self, rapidapi_key: str = None, enable_cache: bool = None, cache_ttl_hours: int = None):
+    def __init__(self, rapidapi_key: str = None, enable_cache: bool = None, cache_ttl_hours: int = None,
+                 session: requests.Session = None):
         """
         Initialize RapidAPI client with multiple key support and caching
         
@@ -78,6 +181,7 @@ class TeraBoxRapidAPI:
             rapidapi_key: Single RapidAPI key for authentication (backward compatibility)
             enable_cache: Enable response caching (overrides config)
             cache_ttl_hours: Cache TTL in hours (overrides config)
+            session: Pre-built HTTP session to use instead of creating one (e.g. a test stub)
             
         Initialization Flow:
         1. Load configuration from centralized config manager
@@ -161,7 +265,7 @@ class TeraBoxRapidAPI:
         # HTTP Session Initialization
         # Purpose: Create session for RapidAPI requests with proper headers
         # Security: Include required RapidAPI authentication headers
-        self.session = requests.Session()
+        self.session = session if session is not None else requests.Session()
         
         # Cache Manager Initialization
         # Purpose: Handle response caching and cache management
@@ -407,64 +511,15 @@ class TeraBoxRapidAPI:
         if not api_key or not isinstance(api_key, str):
             return {'status': 'failed', 'message': 'API key must be a non-empty string'}
         
-        # Remove any whitespace
-        api_key = api_key.strip()
-        
-        # Length validation
-        expected_length = 50
-        if len(api_key) != expected_length:
-            return {
-                'status': 'failed', 
-                'message': f'Invalid API key length. Expected {expected_length} characters, got {len(api_key)}',
-                'details': f'RapidAPI keys are typically {expected_length} characters long'
-            }
-        
-        # Character validation - should only contain allowed characters
-        allowed_chars = set('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789')
-        invalid_chars = set(api_key) - allowed_chars
-        
-        if invalid_chars:
-            return {
-                'status': 'failed',
-                'message': f'API key contains invalid characters: {", ".join(sorted(invalid_chars))}',
-                'details': 'RapidAPI keys should only contain letters and numbers'
-            }
-        
-        # Required marker validation
-        if 'msh' not in api_key.lower():
-            return {
-                'status': 'failed',
-                'message': 'API key missing "msh" marker',
-                'details': 'Valid RapidAPI keys contain "msh" as a marker'
-            }
-        
-        if 'jsn' not in api_key.lower():
-            return {
-                'status': 'failed',
-                'message': 'API key missing "jsn" marker', 
-                'details': 'Valid RapidAPI keys contain "jsn" as a marker'
-            }
-        
-        # Pattern validation - RapidAPI keys typically contain 'msh' and 'jsn' markers
-        # More flexible pattern that allows various configurations
-        rapidapi_pattern = r'^[a-zA-Z0-9]+msh[a-zA-Z0-9]+jsn[a-zA-Z0-9]+$'
-        
-        if not re.match(rapidapi_pattern, api_key, re.IGNORECASE):
-            return {
-                'status': 'failed',
-                'message': 'Invalid API key format. RapidAPI keys should contain "msh" and "jsn" markers',
-                'details': 'Expected format: [alphanumeric]msh[alphanumeric]jsn[alphanumeric]'
-            }
-        
-        return {
-            'status': 'success',
-            'message': 'API key format is valid',
-            'details': {
-                'length': len(api_key),
+        # Checks are cached per raw key; every caller gets freshly built dicts
+        status, message, details = _check_api_key_format(api_key)
+        if status == 'success':
+            details = {
+                'length': _API_KEY_LENGTH,
                 'pattern': 'RapidAPI standard format',
                 'markers': ['msh', 'jsn']
             }
-        }
+        return {'status': status, 'message': message, 'details': details}
     
     def _test_api_key_live(self) -> Dict[str, Any]:
         """Test API key with a live request to verify it works"""
@@ -538,8 +593,10 @@ class TeraBoxRapidAPI:
     
     def is_valid_api_key_format(self, api_key: str) -> bool:
         """Simple boolean check for API key format validity"""
-        result = self._validate_api_key_format(api_key)
-        return result['status'] == 'success'
+        # Same checks as _validate_api_key_format, without building the result dicts
+        if not api_key or not isinstance(api_key, str):
+            return False
+        return _check_api_key_format(api_key)[0] == 'success'
     
     def get_api_key_info(self) -> Dict[str, Any]:
         """Get information about the currently configured API key"""
@@ -602,12 +659,7 @@ class TeraBoxRapidAPI:
                 log_info(f"Attempt {attempt + 1}/{max_attempts} using key: {current_key_id}")
                 
                 # Make API request with current key
-                headers = {
-                    'X-RapidAPI-Key': current_key,
-                    'X-RapidAPI-Host': 'terabox-downloader-direct-download-link-generator2.p.rapidapi.com',
-                    'User-Agent': 'TeraDL-RapidAPI-Client/1.0',
-                    'Accept': 'application/json'
-                }
+                headers = _request_headers(current_key)
                 
                 request_start_time = time.time()
                 
@@ -851,7 +903,9 @@ class TeraBoxRapidAPI:
             log_error(e, "download_file")
             return {'error': f'Download failed: {str(e)}'}
     
-    def _normalize_terabox_url(self, url: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _normalize_terabox_url(url: str) -> str:
         """
         Normalize different TeraBox URL formats to work with RapidAPI
         
@@ -874,10 +928,10 @@ class TeraBoxRapidAPI:
         - freeterabox.com -> preserve original format
         - nephobox.com -> preserve original format
         - Other domains -> convert to standard terabox.app format
+        
+        Results are memoized per URL, so repeated URLs are only logged once.
         """
         log_info(f"Normalizing TeraBox URL: {url}")
-        5
-        import re
         
         # URL Format Detection
         # Purpose: Identify URL format and extract components
@@ -887,15 +941,10 @@ class TeraBoxRapidAPI:
             
             # Extract Short URL Patterns
             # Purpose: Extract surl identifier from different URL formats
-            # Strategy: Try multiple patterns in order of specificity
-            patterns = [
-                r'/s/([^/?&]+)',  # Standard /s/ format: /s/abc123
-                r'surl=([^&]+)',  # Query parameter format: ?surl=abc123
-            ]
-            
+            # Strategy: Try precompiled patterns in order of specificity
             short_url = None
-            for i, pattern in enumerate(patterns):
-                match = re.search(pattern, url)
+            for i, pattern in enumerate(_SHORT_URL_PATTERNS):
+                match = pattern.search(url)
                 if match:
                     short_url = match.group(1)
                     log_info(f"Short URL extracted using pattern {i+1}: {short_url}")
@@ -905,6 +954,8 @@ class TeraBoxRapidAPI:
                 # Domain-Specific URL Normalization
                 # Purpose: Handle different TeraBox domains appropriately
                 # Strategy: Preserve original domain for better compatibility
+                # (URLs are rebuilt from the surl, so a www. host prefix is
+                # dropped here without any string stripping)
                 
                 if 'terasharelink.com' in url:
                     normalized = f"https://terasharelink.com/s/{short_url}"
@@ -947,25 +998,18 @@ class TeraBoxRapidAPI:
         log_info(f"URL normalization fallback - returning original: {url}")
         return url
     
-    def _get_file_type(self, filename: str) -> str:
-        """Determine file type from filename"""
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _get_file_type(filename: str) -> str:
+        """Determine file type from filename (memoized per filename)"""
         if not filename:
             return 'unknown'
         
-        filename_lower = filename.lower()
-        
-        if any(ext in filename_lower for ext in ['.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.m4v']):
-            return 'video'
-        elif any(ext in filename_lower for ext in ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp']):
-            return 'image'
-        elif any(ext in filename_lower for ext in ['.mp3', '.wav', '.flac', '.aac', '.ogg', '.m4a']):
-            return 'audio'
-        elif any(ext in filename_lower for ext in ['.pdf', '.doc', '.docx', '.txt', '.rtf']):
-            return 'document'
-        elif any(ext in filename_lower for ext in ['.zip', '.rar', '.7z', '.tar', '.gz']):
-            return 'archive'
-        else:
+        _, dot, extension = filename.rpartition('.')
+        if not dot:
             return 'other'
+        
+        return _EXTENSION_TYPES.get(extension.lower(), 'other')
     
     def get_api_status(self) -> Dict[str, Any]:
         """Get RapidAPI service status and usage information"""
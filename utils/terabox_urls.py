@@ -0,0 +1,52 @@
+"""
+TeraBox Share Link Matching
+Single compiled pattern for pulling TeraBox/TeraShare share links out of free text
+
+All supported link formats are fused into one alternation so a text is scanned
+once per call, and the pattern is compiled once per process at import.
+
+Supported Formats:
+- https://terasharelink.com/s/<surl>
+- https://terabox.com/s/<surl>, https://1024terabox.com/s/<surl>, https://teraboxapp.com/s/<surl>
+- https://(www.)terabox.app/s/<surl>, https://(www.)1024tera.com/s/<surl>
+- https://www.terabox.app/sharing/link?surl=<surl>
+- https://www.terabox.com/sharing/link?surl=<surl>
+
+Engine:
+- Uses the linear-time RE2 engine when the optional re2 binding is installed
+- Falls back to the stdlib re module otherwise
+"""
+
+import re
+from typing import List
+
+# Prefer the linear-time RE2 engine for scanning untrusted text when installed
+try:
+    import re2 as _link_re
+except ImportError:
+    _link_re = re
+
+# Case-insensitivity is inline ((?i)) because RE2 bindings do not take re flags
+TERABOX_URL_RE = _link_re.compile(
+    r'(?i)https://(?:'
+    r'terasharelink\.com/s/'
+    r'|www\.terabox\.app/sharing/link\?surl='
+    r'|terabox\.com/s/'
+    r'|1024terabox\.com/s/'
+    r'|www\.terabox\.com/sharing/link\?surl='
+    r'|teraboxapp\.com/s/'
+    r'|(?:www\.)?1024tera\.com/s/'
+    r'|(?:www\.)?terabox\.app/s/'
+    r')[A-Za-z0-9_-]+'
+)
+
+
+def extract(text: str) -> List[str]:
+    """Extract unique TeraBox/TeraShare links from text, in order of appearance"""
+    # Every supported host contains one of these; skip the regex scan when none is present
+    text_lower = text.lower()
+    if 'terabox' not in text_lower and '1024tera' not in text_lower and 'terashare' not in text_lower:
+        return []
+
+    # Remove duplicates while preserving order
+    return list(dict.fromkeys(TERABOX_URL_RE.findall(text)))